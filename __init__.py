@@ -4,7 +4,14 @@ import bpy
 from bpy.app.handlers import persistent
 
 from .ui import register_bakers
-from .preferences import generate_pack_enums
+from .baker import Baker
+from .preferences import GRABDOC_PG_properties, generate_pack_enums
+from .utils.session import end_bake_session, subscribe_scene_change
+from .utils.tracker import scene_tracker, subscribe_property_changes
+from .utils.cache import render_cache
+from .utils.render import clear_render_profile
+from .utils.node import material_journal
+from .utils.preset import migrate_legacy_presets
 
 
 #########################
@@ -24,8 +31,22 @@ def init_baker_dependencies():
 #########################
 
 
+# NOTE: Owner of GrabDoc message bus subscriptions
+msgbus_owner = object()
+
+
+@persistent
+def load_pre_handler(_dummy) -> None:
+    end_bake_session(restore=False)
+    clear_render_profile(restore=False)
+    scene_tracker.reset()
+    render_cache.clear()
+    material_journal.clear()
+
+
 @persistent
 def load_post_handler(_dummy) -> None:
+    subscribe_msgbus()
     if not bpy.data.filepath:
         return
     init_baker_dependencies()
@@ -33,11 +54,30 @@ def load_post_handler(_dummy) -> None:
 
 @persistent
 def save_pre_handler(_dummy) -> None:
+    end_bake_session()
     if not bpy.context.scene.gd.preview_state:
         return
     bpy.ops.grabdoc.baker_preview_exit()
 
 
+@persistent
+def undo_pre_handler(_dummy) -> None:
+    end_bake_session()
+    scene_tracker.reset()
+
+
+@persistent
+def depsgraph_update_post_handler(_scene, depsgraph) -> None:
+    scene_tracker.depsgraph_update(depsgraph)
+
+
+def subscribe_msgbus() -> None:
+    subscribe_scene_change(msgbus_owner)
+    subscribe_property_changes(
+        msgbus_owner, [GRABDOC_PG_properties, *Baker.__subclasses__()]
+    )
+
+
 #########################
 # REGISTRATION
 #########################
@@ -61,10 +101,28 @@ for module_name in module_names:
 def register():
     for mod in modules:
         mod.register()
+    migrate_legacy_presets()
 
+    bpy.app.handlers.load_pre.append(load_pre_handler)
     bpy.app.handlers.load_post.append(load_post_handler)
     bpy.app.handlers.save_pre.append(save_pre_handler)
+    bpy.app.handlers.undo_pre.append(undo_pre_handler)
+    bpy.app.handlers.redo_pre.append(undo_pre_handler)
+    bpy.app.handlers.depsgraph_update_post.append(
+        depsgraph_update_post_handler
+    )
+    subscribe_msgbus()
 
 def unregister():
+    end_bake_session()
+    bpy.msgbus.clear_by_owner(msgbus_owner)
+    for handlers, handler in ((bpy.app.handlers.load_pre,  load_pre_handler),
+                              (bpy.app.handlers.undo_pre,  undo_pre_handler),
+                              (bpy.app.handlers.redo_pre,  undo_pre_handler),
+                              (bpy.app.handlers.depsgraph_update_post,
+                               depsgraph_update_post_handler)):
+        if handler in handlers:
+            handlers.remove(handler)
+
     for mod in modules:
         mod.unregister()
@@ -1,5 +1,8 @@
+import numpy # pylint: disable=E0401
+
 import bpy
-from bpy.types import PropertyGroup, UILayout, Context, NodeTree
+from bpy.types import (PropertyGroup, UILayout, Context,
+                       NodeTree, NodeSocket, Node)
 from bpy.props import (BoolProperty, StringProperty, EnumProperty,
                        IntProperty, FloatProperty, PointerProperty)
 
@@ -8,7 +11,26 @@ from .utils.scene import scene_setup
 from .utils.node import (generate_shader_interface, link_group_to_object,
                          get_group_inputs, get_material_output_sockets)
 from .utils.render import (set_guide_height, get_rendered_objects,
-                           set_color_management)
+                           set_color_management, apply_render_profile)
+from .utils.library import load_library_node_group, save_library_node_group
+from .utils.generic import is_update_suppressed
+
+
+# NOTE: Cycles settings for shaders ending in an Emission shader seen
+# straight through the ortho camera, light transport is never sampled
+EMISSION_PROFILE: dict[str, dict] = {
+    'scene.cycles': {'max_bounces':           0,
+                     'diffuse_bounces':       0,
+                     'glossy_bounces':        0,
+                     'transmission_bounces':  0,
+                     'volume_bounces':        0,
+                     'caustics_reflective':   False,
+                     'caustics_refractive':   False,
+                     'use_light_tree':        False,
+                     'use_adaptive_sampling': False,
+                     'use_denoising':         False},
+    'scene.render': {'use_motion_blur': False}
+}
 
 
 class Baker(PropertyGroup):
@@ -25,8 +47,14 @@ class Baker(PropertyGroup):
     NAME:                       str = ID.capitalize()
     VIEW_TRANSFORM:             str = 'Standard'
     MARMOSET_COMPATIBLE:       bool = True
+    AOV_COMPATIBLE:            bool = False
+    DENOISE_COMPATIBLE:        bool = False
+    NODE_LIBRARY:              bool = True
     REQUIRED_SOCKETS:    tuple[str] = ()
     OPTIONAL_SOCKETS:    tuple[str] = ('Alpha',)
+    NATIVE_PASSES:       tuple[str] = ()
+    TONAL_PROPERTIES:    tuple[str] = ()
+    RENDER_PROFILE: dict[str, dict] = EMISSION_PROFILE
     SUPPORTED_ENGINES               = ((Global.EEVEE_NAME,   "EEVEE",     ""),
                                        ('cycles',            "Cycles",    ""),
                                        ('blender_workbench', "Workbench", ""))
@@ -36,7 +64,7 @@ class Baker(PropertyGroup):
         if self.index != -1:
             return
         self.set_available_index()
-        self.node_setup()
+        self.load_node_tree()
 
         # NOTE: Unique due to dynamic items/enum
         self.__class__.engine = EnumProperty(
@@ -73,6 +101,26 @@ class Baker(PropertyGroup):
         """General operations to run before bake export."""
         self.apply_render_settings(requires_preview=False)
 
+    def load_node_tree(self) -> None:
+        """Get the baker node group, appending it from the node
+        library or building and storing it there on first use."""
+        if not self.NODE_LIBRARY:
+            self.node_setup()
+            return
+        node_name = Global.FLAG_PREFIX + self.get_display_name()
+        self.node_tree = bpy.data.node_groups.get(node_name)
+        if self.node_tree is None:
+            self.node_tree = load_library_node_group(self.ID, node_name)
+        if self.node_tree is None:
+            self.node_setup()
+            save_library_node_group(self.ID, self.node_tree)
+        self.node_tree.use_fake_user = True
+        self.node_update(bpy.context)
+
+    def node_update(self, context: Context) -> None:
+        """Apply property driven values to the node group,
+        used to parameterize node groups from the node library."""
+
     def node_setup(self):
         """Shader logic to generate a node group.
 
@@ -104,9 +152,118 @@ class Baker(PropertyGroup):
     def cleanup(self):
         """Operations to revert unique scene modifications after bake export."""
 
+    def get_aov_name(self) -> str:
+        """Get the shader AOV name used for single render exports."""
+        return f"{Global.AOV_PREFIX}{self.ID}_{self.index}"
+
+    def get_emission_node(self) -> Node | None:
+        """Get the `Emission` shader connected to the group output."""
+        for node in self.node_tree.nodes:
+            if node.type != 'GROUP_OUTPUT':
+                continue
+            for node_input in node.inputs:
+                if node_input.type != 'SHADER' or not node_input.links:
+                    continue
+                from_node = node_input.links[0].from_node
+                if from_node.type == 'EMISSION':
+                    return from_node
+        return None
+
+    def get_aov_socket(self) -> NodeSocket | None:
+        """Get the socket holding the color of the rendered map."""
+        emission = self.get_emission_node()
+        if emission is None or not emission.inputs['Color'].links:
+            return None
+        return emission.inputs['Color'].links[0].from_socket
+
+    def aov_setup(self) -> bool:
+        """Write the map color to a named shader AOV so
+        multiple bakers can be exported from a single render.
+
+        Returns False if the baker can't be exported this way."""
+        if not self.AOV_COMPATIBLE or not self.node_tree:
+            return False
+        socket = self.get_aov_socket()
+        if socket is None:
+            return False
+        aov = self.node_tree.nodes.get(Global.AOV_NODE_NAME)
+        if aov is None:
+            aov = self.node_tree.nodes.new('ShaderNodeOutputAOV')
+            aov.name = Global.AOV_NODE_NAME
+            aov.location = (0, -200)
+        aov.aov_name = self.get_aov_name()
+        self.node_tree.links.new(aov.inputs['Color'], socket)
+        return True
+
+    def aov_cleanup(self) -> None:
+        """Remove the nodes added by `aov_setup` from the node group."""
+        if not self.node_tree:
+            return
+        for name in (Global.AOV_NODE_NAME, Global.AOV_SCALE_NAME):
+            node = self.node_tree.nodes.get(name)
+            if node is not None:
+                self.node_tree.nodes.remove(node)
+
+    def is_denoised(self) -> bool:
+        """Decide whether exports of this baker run through the denoiser."""
+        return self.DENOISE_COMPATIBLE and self.use_denoise \
+           and str(self.engine).upper() == 'CYCLES'
+
+    def native_setup(self) -> None:
+        """Operations to run before rendering native Cycles passes."""
+
+    def shares_native_render(self, other: 'Baker') -> bool:
+        """Decide whether this baker can use the same native pass render."""
+        return self.disable_filtering == other.disable_filtering
+
+    def process_native_passes(
+            self, passes: dict[str, numpy.ndarray]
+        ) -> numpy.ndarray:
+        """Convert the `NATIVE_PASSES` pixels of a render into the final
+        flat RGBA map pixels. Only required if `NATIVE_PASSES` is set."""
+
+    @staticmethod
+    def gray_to_pixels(
+            value: numpy.ndarray, alpha: numpy.ndarray
+        ) -> numpy.ndarray:
+        """Expand single channel values into flat RGBA pixels."""
+        pixels = numpy.empty(len(value) * 4, dtype=numpy.float32)
+        pixels[0::4] = pixels[1::4] = pixels[2::4] = value
+        pixels[3::4] = alpha
+        return pixels
+
+    def get_tonal_properties(self) -> tuple[str]:
+        """Get the `TONAL_PROPERTIES` that can currently be
+        applied after rendering by `grade_pixels`."""
+        return self.TONAL_PROPERTIES
+
+    def tonal_setup(self) -> None:
+        """Reset the shader nodes driven by `TONAL_PROPERTIES` to neutral
+        values, so renders can be cached and graded by `grade_pixels`."""
+
+    def grade_pixels(self, pixels: numpy.ndarray) -> numpy.ndarray:
+        """Apply `TONAL_PROPERTIES` to a copy of neutral render pixels,
+        matching the result of the shader nodes."""
+        return pixels.copy()
+
+    @staticmethod
+    def grade_straight(
+            pixels: numpy.ndarray, grade, channels: slice=slice(0, 3)
+        ) -> numpy.ndarray:
+        """Apply `grade` to the straight color of the given `channels`
+        of premultiplied flat RGBA pixels."""
+        rgba  = pixels.reshape(-1, 4).copy()
+        alpha = rgba[:, 3:4]
+        straight = numpy.divide(rgba[:, channels], alpha,
+                                out=numpy.zeros_like(rgba[:, channels]),
+                                where=alpha > 0)
+        rgba[:, channels] = grade(straight) * alpha
+        return rgba.reshape(-1)
+
     def apply_render_settings(self, requires_preview: bool=True) -> None:
         """Apply global baker render and color management settings."""
-        if requires_preview and not bpy.context.scene.gd.preview_state:
+        if requires_preview and not bpy.context.scene.gd.preview_state \
+        or is_update_suppressed():
             return
 
         scene  = bpy.context.scene
@@ -126,6 +283,9 @@ class Baker(PropertyGroup):
             cycles.samples = cycles.preview_samples = self.samples_cycles
         elif render.engine == 'BLENDER_WORKBENCH':
             display.render_aa = display.viewport_aa = self.samples_workbench
+        is_cycles = render.engine == 'CYCLES'
+        apply_render_profile(bpy.context,
+                             self.RENDER_PROFILE if is_cycles else {})
 
         set_color_management(self.VIEW_TRANSFORM,
                              self.contrast.replace('_', ' '))
@@ -165,6 +325,8 @@ class Baker(PropertyGroup):
             elif self.engine == 'cycles':
                 prop = 'samples_cycles'
             col_set.prop(self, prop, text='Samples')
+            if self.DENOISE_COMPATIBLE and self.engine == 'cycles':
+                col_set.prop(self, 'use_denoise')
             col_set.prop(self, 'contrast')
         col_set.prop(self, 'suffix')
 
@@ -225,6 +387,12 @@ class Baker(PropertyGroup):
                ('32',   "32 Samples",       "")),
         name="Workbench Samples", default="8", update=apply_render_settings
     )
+    use_denoise: BoolProperty(
+        description=\
+"""Denoise exported maps with OpenImageDenoise on the CPU,
+allowing far lower Cycles sample counts""",
+        name="Denoise", default=False
+    )
     contrast: EnumProperty(
         items=(('None',                 "Default", ""),
                ('Very_High_Contrast',   "Very High",     ""),
@@ -244,8 +412,26 @@ class Normals(Baker):
     MARMOSET_COMPATIBLE = True
     REQUIRED_SOCKETS    = ()
     OPTIONAL_SOCKETS    = ('Alpha', 'Normal')
+    NATIVE_PASSES       = ('Normal',)
+    TONAL_PROPERTIES    = ('flip_y',)
     SUPPORTED_ENGINES   = Baker.SUPPORTED_ENGINES[:-1]
 
+    def process_native_passes(self, passes):
+        # NOTE: The Normal pass is in world space, multiplying row vectors
+        # by the camera rotation applies its transpose (world to camera)
+        camera = bpy.data.objects[Global.TRIM_CAMERA_NAME]
+        rotation = numpy.array(
+            camera.matrix_world.to_quaternion().to_matrix(),
+            dtype=numpy.float32
+        )
+        normals = passes['Normal'].reshape(-1, 4)[:, :3] @ rotation
+        pixels = numpy.empty(passes['Normal'].size, dtype=numpy.float32)
+        pixels[0::4] = normals[:, 0] * .5 + .5
+        pixels[1::4] = normals[:, 1] * (-.5 if self.flip_y else .5) + .5
+        pixels[2::4] = normals[:, 2] * .5 + .5
+        pixels[3::4] = passes['Alpha'][0::4]
+        return pixels
+
     def node_setup(self):
         super().node_setup()
         self.node_tree.interface.new_socket(
@@ -348,6 +534,19 @@ class Normals(Baker):
             if self.engine == 'cycles':
                 col.prop(self, 'bevel_weight')
 
+    def node_update(self, context: Context):
+        self.update_flip_y(context)
+        self.update_bevel_weight(context)
+
+    def tonal_setup(self):
+        vec_mult = self.node_tree.nodes['Vector Math']
+        vec_mult.inputs[1].default_value[1] = .5
+
+    def grade_pixels(self, pixels):
+        if not self.flip_y:
+            return pixels.copy()
+        return self.grade_straight(pixels, lambda y: 1 - y, slice(1, 2))
+
     def update_flip_y(self, _context: Context):
         vec_mult = self.node_tree.nodes['Vector Math']
         vec_mult.inputs[1].default_value[1] = -.5 if self.flip_y else .5
@@ -372,6 +571,7 @@ class Curvature(Baker):
     NAME                = ID.capitalize()
     VIEW_TRANSFORM      = "Standard"
     MARMOSET_COMPATIBLE = True
+    DENOISE_COMPATIBLE  = True
     REQUIRED_SOCKETS    = ()
     OPTIONAL_SOCKETS    = ()
     SUPPORTED_ENGINES   = (('blender_workbench',  "Workbench", ""),
@@ -436,6 +636,9 @@ class Curvature(Baker):
     def cleanup(self) -> None:
         bpy.data.objects[Global.BG_PLANE_NAME].color[3] = 1
 
+    def node_update(self, context: Context):
+        self.update_range(context)
+
     def update_curvature(self, context: Context):
         if not context.scene.gd.preview_state:
             return
@@ -464,8 +667,11 @@ class Occlusion(Baker):
     NAME                = ID.capitalize()
     VIEW_TRANSFORM      = "Raw"
     MARMOSET_COMPATIBLE = True
+    DENOISE_COMPATIBLE  = True
     REQUIRED_SOCKETS    = ()
     OPTIONAL_SOCKETS    = ('Alpha', 'Normal')
+    NATIVE_PASSES       = ('AO',)
+    TONAL_PROPERTIES    = ('invert',)
     SUPPORTED_ENGINES   = Baker.SUPPORTED_ENGINES[:-1]
 
     def setup(self) -> None:
@@ -475,6 +681,24 @@ class Occlusion(Baker):
             scene.eevee.use_overscan  = True
             scene.eevee.overscan_size = 25
 
+    def native_setup(self) -> None:
+        world = bpy.context.scene.world
+        if world is not None:
+            world.light_settings.distance = self.distance
+
+    def shares_native_render(self, other: Baker) -> bool:
+        # NOTE: AO pass distance is shared through the world settings
+        if other.ID == self.ID and other.distance != self.distance:
+            return False
+        return super().shares_native_render(other)
+
+    def process_native_passes(self, passes):
+        occlusion = passes['AO'][0::4]
+        if self.invert:
+            occlusion = 1 - occlusion
+        occlusion = numpy.power(numpy.maximum(occlusion, 0), self.gamma)
+        return self.gray_to_pixels(occlusion, passes['Alpha'][0::4])
+
     def node_setup(self):
         super().node_setup()
         self.node_tree.interface.new_socket(
@@ -560,6 +784,27 @@ class Occlusion(Baker):
         col.prop(self, 'gamma')
         col.prop(self, 'distance')
 
+    def node_update(self, context: Context):
+        self.update_gamma(context)
+        self.update_distance(context)
+        self.update_invert(context)
+
+    def get_tonal_properties(self):
+        # NOTE: Gamma is applied per sample after inverting, so
+        # neither can be applied to the averaged render unless linear
+        if self.gamma != 1:
+            return ()
+        return self.TONAL_PROPERTIES
+
+    def tonal_setup(self):
+        if self.get_tonal_properties():
+            self.node_tree.nodes['Invert Color'].inputs[0].default_value = 0
+
+    def grade_pixels(self, pixels):
+        if not self.get_tonal_properties() or not self.invert:
+            return pixels.copy()
+        return self.grade_straight(pixels, lambda color: 1 - color)
+
     def update_gamma(self, _context: Context):
         gamma = self.node_tree.nodes['Gamma']
         gamma.inputs[1].default_value = self.gamma
@@ -594,6 +839,7 @@ class Height(Baker):
     MARMOSET_COMPATIBLE = True
     REQUIRED_SOCKETS    = ()
     OPTIONAL_SOCKETS    = ()
+    NATIVE_PASSES       = ('Depth',)
     SUPPORTED_ENGINES   = Baker.SUPPORTED_ENGINES[:-1]
 
     def setup(self) -> None:
@@ -601,6 +847,16 @@ class Height(Baker):
         if self.method == 'auto':
             set_guide_height(get_rendered_objects())
 
+    def process_native_passes(self, passes):
+        camera_object_z = Global.CAMERA_DISTANCE * bpy.context.scene.gd.scale
+        depth = passes['Depth'][0::4]
+        height = numpy.clip(
+            (depth - (camera_object_z - self.distance)) / self.distance, 0, 1
+        )
+        if not self.invert:
+            height = 1 - height
+        return self.gray_to_pixels(height, passes['Alpha'][0::4])
+
     def node_setup(self):
         super().node_setup()
 
@@ -638,7 +894,7 @@ class Height(Baker):
             return
         set_guide_height(get_rendered_objects())
 
-    def update_guide(self, context: Context):
+    def node_update(self, _context: Context):
         map_range = self.node_tree.nodes['Map Range']
         camera_object_z = Global.CAMERA_DISTANCE * bpy.context.scene.gd.scale
         map_range.inputs[1].default_value = camera_object_z - self.distance
@@ -651,6 +907,8 @@ class Height(Baker):
             (1, 1, 1, 1) if self.invert else (0, 0, 0, 1)
         ramp.location = (-400, 0)
 
+    def update_guide(self, context: Context):
+        self.node_update(context)
         if self.method == 'manual':
             scene_setup(self, context)
 
@@ -679,6 +937,7 @@ class Id(Baker):
     MARMOSET_COMPATIBLE = True
     REQUIRED_SOCKETS    = ()
     OPTIONAL_SOCKETS    = ()
+    NODE_LIBRARY        = False
     SUPPORTED_ENGINES   = (Baker.SUPPORTED_ENGINES[-1],)
 
     def initialize(self):
@@ -750,6 +1009,7 @@ class Alpha(Baker):
     MARMOSET_COMPATIBLE = True
     REQUIRED_SOCKETS    = ()
     OPTIONAL_SOCKETS    = Baker.OPTIONAL_SOCKETS
+    NATIVE_PASSES       = ('Depth',)
     SUPPORTED_ENGINES   = Baker.SUPPORTED_ENGINES[:-1]
 
     def node_setup(self):
@@ -809,6 +1069,19 @@ class Alpha(Baker):
     def reimport_setup(self, _material, _bsdf, image):
         image.image.colorspace_settings.name = 'Non-Color'
 
+    def process_native_passes(self, passes):
+        camera_object_z = Global.CAMERA_DISTANCE * bpy.context.scene.gd.scale
+        depth = passes['Depth'][0::4]
+        mask = numpy.clip(
+            (depth - (camera_object_z - .00001)) / .00001, 0, 1
+        )
+        if not self.invert_depth:
+            mask = 1 - mask
+        return self.gray_to_pixels(mask, passes['Alpha'][0::4])
+
+    def node_update(self, context: Context):
+        self.update_map_range(context)
+
     def update_map_range(self, _context: Context):
         map_range = self.node_tree.nodes['Map Range']
         camera_object_z = Global.CAMERA_DISTANCE * bpy.context.scene.gd.scale
@@ -827,8 +1100,10 @@ class Roughness(Baker):
     NAME                = ID.capitalize()
     VIEW_TRANSFORM      = "Raw"
     MARMOSET_COMPATIBLE = False
+    AOV_COMPATIBLE      = True
     REQUIRED_SOCKETS    = (NAME,)
     OPTIONAL_SOCKETS    = ()
+    TONAL_PROPERTIES    = ('invert',)
     SUPPORTED_ENGINES   = Baker.SUPPORTED_ENGINES[:-1]
 
     def node_setup(self):
@@ -859,6 +1134,17 @@ class Roughness(Baker):
         links = material.node_tree.links
         links.new(bsdf.inputs["Roughness"], image.outputs["Color"])
 
+    def node_update(self, context: Context):
+        self.update_invert(context)
+
+    def tonal_setup(self):
+        self.node_tree.nodes['Invert Color'].inputs[0].default_value = 0
+
+    def grade_pixels(self, pixels):
+        if not self.invert:
+            return pixels.copy()
+        return self.grade_straight(pixels, lambda color: 1 - color)
+
     def update_invert(self, _context: Context):
         invert = self.node_tree.nodes['Invert Color']
         invert.inputs[0].default_value = 1 if self.invert else 0
@@ -872,6 +1158,7 @@ class Color(Baker):
     NAME                = "Base Color"
     VIEW_TRANSFORM      = "Standard"
     MARMOSET_COMPATIBLE = False
+    AOV_COMPATIBLE      = True
     REQUIRED_SOCKETS    = (NAME,)
     OPTIONAL_SOCKETS    = ()
     SUPPORTED_ENGINES   = Baker.SUPPORTED_ENGINES[:-1]
@@ -901,6 +1188,7 @@ class Emissive(Baker):
     NAME                = ID.capitalize()
     VIEW_TRANSFORM      = "Standard"
     MARMOSET_COMPATIBLE = False
+    AOV_COMPATIBLE      = True
     REQUIRED_SOCKETS    = ("Emission Color", "Emission Strength")
     OPTIONAL_SOCKETS    = ()
     SUPPORTED_ENGINES   = Baker.SUPPORTED_ENGINES[:-1]
@@ -931,14 +1219,33 @@ class Emissive(Baker):
         links = material.node_tree.links
         links.new(bsdf.inputs["Emission Color"], image.outputs["Color"])
 
+    def get_aov_socket(self) -> NodeSocket | None:
+        color = super().get_aov_socket()
+        emission = self.get_emission_node()
+        if color is None or not emission.inputs['Strength'].links:
+            return color
+        scale = self.node_tree.nodes.get(Global.AOV_SCALE_NAME)
+        if scale is None:
+            scale = self.node_tree.nodes.new('ShaderNodeVectorMath')
+            scale.name = Global.AOV_SCALE_NAME
+            scale.operation = 'SCALE'
+            scale.location = (-200, -200)
+        links = self.node_tree.links
+        links.new(scale.inputs[0], color)
+        links.new(scale.inputs['Scale'],
+                  emission.inputs['Strength'].links[0].from_socket)
+        return scale.outputs[0]
+
 
 class Metallic(Baker):
     ID                  = 'metallic'
     NAME                = ID.capitalize()
     VIEW_TRANSFORM      = "Raw"
     MARMOSET_COMPATIBLE = False
+    AOV_COMPATIBLE      = True
     REQUIRED_SOCKETS    = (NAME,)
     OPTIONAL_SOCKETS    = ()
+    TONAL_PROPERTIES    = ('invert',)
     SUPPORTED_ENGINES   = Baker.SUPPORTED_ENGINES[:-1]
 
     def node_setup(self):
@@ -956,7 +1263,8 @@ class Metallic(Baker):
         emission.location = (-200, 0)
 
         links = self.node_tree.links
-        links.new(emission.inputs["Color"], self.node_input.outputs["Metallic"])
+        links.new(invert.inputs["Color"], self.node_input.outputs["Metallic"])
+        links.new(emission.inputs["Color"], invert.outputs["Color"])
         links.new(self.node_output.inputs["Shader"],
                   emission.outputs["Emission"])
 
@@ -968,6 +1276,17 @@ class Metallic(Baker):
     def draw_properties(self, _context: Context, layout: UILayout):
         layout.prop(self, 'invert', text="Invert")
 
+    def node_update(self, context: Context):
+        self.update_invert(context)
+
+    def tonal_setup(self):
+        self.node_tree.nodes['Invert Color'].inputs[0].default_value = 0
+
+    def grade_pixels(self, pixels):
+        if not self.invert:
+            return pixels.copy()
+        return self.grade_straight(pixels, lambda color: 1 - color)
+
     def update_invert(self, _context: Context):
         invert = self.node_tree.nodes['Invert Color']
         invert.inputs[0].default_value = 1 if self.invert else 0
@@ -980,8 +1299,11 @@ class Custom(Baker):
     NAME                = ID.capitalize()
     VIEW_TRANSFORM      = "Raw"
     MARMOSET_COMPATIBLE = False
+    AOV_COMPATIBLE      = True
+    NODE_LIBRARY        = False
     REQUIRED_SOCKETS    = ()
     OPTIONAL_SOCKETS    = ()
+    RENDER_PROFILE      = {}
     SUPPORTED_ENGINES   = Baker.SUPPORTED_ENGINES[:-1]
 
     def update_view_transform(self, _context: Context):
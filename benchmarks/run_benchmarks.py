@@ -0,0 +1,258 @@
+"""Headless GrabDoc benchmark suite.
+
+Generates parametrised trim scenes and times each export stage
+separately, writing results as JSON to compare GrabDoc versions.
+
+GrabDoc must be installed as an extension, e.g. by adding
+this repository as a local extension repository.
+
+Usage:
+    blender -b --python benchmarks/run_benchmarks.py -- \\
+        --objects 1 10 --materials 1 8 --output results.json"""
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import platform
+import tempfile
+import importlib
+import itertools
+import statistics
+from contextlib import contextmanager
+
+import numpy # pylint: disable=E0401
+
+import bpy
+import bmesh
+import addon_utils
+
+
+STAGES = ('scene_setup', 'baker_setup', 'get_rendered_objects',
+          'link_group_to_object', 'render', 'node_cleanup',
+          'pack_image_channels', 'import_baker_textures')
+
+# NOTE: Cycled through when adding modifiers to generated objects
+MODIFIERS = (('SUBSURF',     {'levels': 2, 'render_levels': 2}),
+             ('BEVEL',       {'width': .02, 'segments': 3}),
+             ('SOLIDIFY',    {'thickness': .05}),
+             ('TRIANGULATE', {}),
+             ('DISPLACE',    {'strength': .05}))
+
+
+class StageTimer():
+    """Accumulate the time spent in each named stage."""
+    def __init__(self):
+        self.timings: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.timings[name] = self.timings.get(name, 0) + elapsed
+
+
+def parse_args() -> argparse.Namespace:
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(
+        prog="run_benchmarks.py", description="GrabDoc benchmark suite"
+    )
+    parser.add_argument('--objects', type=int, nargs='+', default=[1, 25],
+                        help="Number of objects per scene")
+    parser.add_argument('--materials', type=int, nargs='+', default=[1, 8],
+                        help="Number of unique materials per scene")
+    parser.add_argument('--slots', type=int, nargs='+', default=[1, 4],
+                        help="Material slots per object")
+    parser.add_argument('--modifiers', type=int, nargs='+', default=[0, 3],
+                        help="Modifiers per object")
+    parser.add_argument('--resolution', type=int, nargs='+', default=[512],
+                        help="Square export resolution")
+    parser.add_argument('--bakers', nargs='+',
+                        default=['normals', 'occlusion', 'roughness', 'color'],
+                        help="Bake map IDs to export")
+    parser.add_argument('--samples', type=int, default=1,
+                        help="Cycles samples per bake map")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Runs per parameter combination")
+    parser.add_argument('--output', default="grabdoc_benchmark.json",
+                        help="Path of the JSON results")
+    return parser.parse_args(argv)
+
+
+def enable_grabdoc() -> str:
+    """Enable the installed GrabDoc extension and return its package name."""
+    for module in addon_utils.modules():
+        if module.__name__.rsplit('.', maxsplit=1)[-1] == 'GrabDoc':
+            addon_utils.enable(module.__name__, default_set=True)
+            return module.__name__
+    raise RuntimeError("GrabDoc is not installed as an extension")
+
+
+def generate_mesh(name: str, slots: int) -> bpy.types.Mesh:
+    """Create a sphere mesh with faces spread across material slots."""
+    bm = bmesh.new()
+    bmesh.ops.create_uvsphere(bm, u_segments=32, v_segments=16, radius=1)
+    for face in bm.faces:
+        face.material_index = face.index % slots
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+    return mesh
+
+
+def generate_scene(params: dict, filepath: str) -> None:
+    """Create and save a new trim scene from the given parameters."""
+    bpy.ops.wm.read_homefile(use_empty=True)
+    scene = bpy.context.scene
+
+    materials = []
+    for idx in range(params['materials']):
+        mat = bpy.data.materials.new(f"Benchmark Material {idx}")
+        mat.use_nodes = True
+        bsdf = mat.node_tree.nodes['Principled BSDF']
+        bsdf.inputs['Base Color'].default_value = \
+            (*numpy.random.default_rng(idx).random(3), 1)
+        bsdf.inputs['Roughness'].default_value = idx / params['materials']
+        materials.append(mat)
+
+    # NOTE: Objects are laid out in a grid covering the default trim plane
+    grid = math.ceil(math.sqrt(params['objects']))
+    spacing = 2 / grid
+    for idx in range(params['objects']):
+        mesh = generate_mesh(f"Benchmark Mesh {idx}", params['slots'])
+        for slot in range(params['slots']):
+            mesh.materials.append(materials[(idx + slot) % len(materials)])
+        ob = bpy.data.objects.new(f"Benchmark Object {idx}", mesh)
+        ob.location = (spacing * (idx % grid + .5) - 1,
+                       spacing * (idx // grid + .5) - 1, 0)
+        ob.scale = (spacing * .4,) * 3
+        scene.collection.objects.link(ob)
+        for mod_type, settings in itertools.islice(
+                itertools.cycle(MODIFIERS), params['modifiers']
+            ):
+            modifier = ob.modifiers.new(mod_type.capitalize(), mod_type)
+            for attr, value in settings.items():
+                setattr(modifier, attr, value)
+
+    bpy.ops.wm.save_as_mainfile(filepath=filepath)
+
+
+def run_case(package: str, params: dict, args: argparse.Namespace,
+             workdir: str) -> dict[str, float]:
+    """Generate a scene and time a full export of it."""
+    export_op = importlib.import_module(f"{package}.operators.core")
+    utils_baker = importlib.import_module(f"{package}.utils.baker")
+    utils_node = importlib.import_module(f"{package}.utils.node")
+    utils_pack = importlib.import_module(f"{package}.utils.pack")
+    utils_render = importlib.import_module(f"{package}.utils.render")
+
+    generate_scene(params, os.path.join(workdir, "benchmark.blend"))
+    context = bpy.context
+    scene = context.scene
+    gd = scene.gd
+    gd.filepath = workdir
+    gd.filename = "benchmark"
+    gd.resolution_lock = False
+    gd.resolution_x = gd.resolution_y = params['resolution']
+    scene.cycles.device = 'CPU'
+
+    timer = StageTimer()
+    with timer.stage('scene_setup'):
+        bpy.ops.grabdoc.scene_setup()
+
+    bakers = []
+    for baker in utils_baker.get_bakers():
+        baker.enabled = baker.ID in args.bakers
+        if not baker.enabled:
+            continue
+        if 'cycles' in (engine[0] for engine in baker.SUPPORTED_ENGINES):
+            baker.engine = 'cycles'
+        baker.samples_cycles = args.samples
+        bakers.append(baker)
+
+    with timer.stage('baker_setup'):
+        saved_properties = utils_baker.baker_setup(context)
+    with timer.stage('get_rendered_objects'):
+        objects = utils_render.get_rendered_objects()
+    for baker in bakers:
+        baker.setup()
+        with timer.stage('link_group_to_object'):
+            for ob in objects:
+                utils_node.link_group_to_object(ob, baker.node_tree)
+        with timer.stage('render'):
+            export_op.GRABDOC_OT_baker_export.export(context, baker.suffix)
+        baker.cleanup()
+        with timer.stage('node_cleanup'):
+            utils_node.node_cleanup()
+    utils_baker.baker_cleanup(context, saved_properties)
+
+    size = params['resolution'] * params['resolution']
+    channels = [numpy.random.default_rng(idx).random(size, numpy.float32)
+                for idx in range(4)]
+    with timer.stage('pack_image_channels'):
+        image = utils_pack.pack_image_channels(
+            channels, "benchmark_pack", (params['resolution'],) * 2
+        )
+    bpy.data.images.remove(image)
+
+    with timer.stage('import_baker_textures'):
+        utils_baker.import_baker_textures(bakers)
+    return timer.timings
+
+
+def summarize(runs: list[dict[str, float]]) -> dict[str, dict]:
+    """Reduce the stage timings of every run to summary statistics."""
+    summary = {}
+    for stage in STAGES:
+        timings = [run[stage] for run in runs if stage in run]
+        if not timings:
+            continue
+        summary[stage] = {'min':    min(timings),
+                          'median': statistics.median(timings),
+                          'mean':   statistics.fmean(timings),
+                          'runs':   timings}
+    return summary
+
+
+def main():
+    args = parse_args()
+    package = enable_grabdoc()
+    utils_generic = importlib.import_module(f"{package}.utils.generic")
+
+    results = {
+        'grabdoc_version': utils_generic.get_version(),
+        'blender_version': bpy.app.version_string,
+        'blender_hash':    bpy.app.build_hash.decode(),
+        'platform':        platform.platform(),
+        'processor':       platform.processor(),
+        'timestamp':       time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        'arguments':       vars(args),
+        'cases':           []
+    }
+
+    grid = itertools.product(args.objects, args.materials, args.slots,
+                             args.modifiers, args.resolution)
+    for objects, materials, slots, modifiers, resolution in grid:
+        params = {'objects':    objects,
+                  'materials':  materials,
+                  'slots':      slots,
+                  'modifiers':  modifiers,
+                  'resolution': resolution}
+        print(f"GrabDoc benchmark: {params}")
+        runs = []
+        for _ in range(args.repeat):
+            with tempfile.TemporaryDirectory(prefix="grabdoc_bench_") as workdir:
+                runs.append(run_case(package, params, args, workdir))
+        results['cases'].append({'params': params, 'stages': summarize(runs)})
+
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+    print(f"GrabDoc benchmark results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,11 @@ class Global:
     REIMPORT_MAT_NAME = FLAG_PREFIX + "Bake Result"
     COLL_CORE_NAME    = FLAG_PREFIX + "Core"
     COLL_GROUP_NAME   = FLAG_PREFIX + "Bake Group"
+    AOV_NODE_NAME     = FLAG_PREFIX + "AOV Output"
+    AOV_SCALE_NAME    = FLAG_PREFIX + "AOV Scale"
+    AOV_PREFIX        = "gd_"
+    SWITCHER_NAME     = FLAG_PREFIX + "Switcher"
+    SELECTOR_NAME     = FLAG_PREFIX + "Selector"
 
     CAMERA_DISTANCE = 15
 
@@ -52,6 +57,10 @@ class Error:
     MARMOSET_EXPORT_COMPLETE  = "Export completed! Opening Marmoset Toolbag..."
     MARMOSET_REFRESH_COMPLETE = "Models re-exported! Switch to Marmoset Toolbag"
     EXPORT_COMPLETE           = "Export completed!"
+    MAPS_UP_TO_DATE           = "All bake maps are up to date"
+    EXPORT_CANCELLED          = "Export cancelled"
+    BAKE_SESSION_ACTIVE       = "Cannot do this during a Bake Session"
+    PRESET_INVALID            = "Preset file could not be read"
     CAMERA_NOT_FOUND          = \
         "GrabDoc camera not found, please run the Refresh Scene operator"
     MISSING_LINKS             = \
@@ -1,27 +1,64 @@
 import os
+import re
+import json
 import time
 
+import numpy # pylint: disable=E0401
+
 import bpy
 import blf
 from bpy.types import SpaceView3D, Event, Context, Operator, UILayout
-from bpy.props import StringProperty, IntProperty
+from bpy.props import StringProperty, IntProperty, BoolProperty, EnumProperty
 
 from ..constants import Global, Error
 from ..__init__ import init_baker_dependencies
-from ..utils.io import get_format, get_temp_path, get_filepath
-from ..utils.render import get_rendered_objects
-from ..utils.generic import get_user_preferences
-from ..utils.node import link_group_to_object, node_cleanup
+from ..baker import Baker
+from ..utils.io import (
+    get_format, get_temp_path, get_filepath,
+    load_image_pixels, save_image_pixels
+)
+from ..utils.render import (
+    get_rendered_objects, set_color_management, is_tiled_render,
+    render_tiled, run_render_job, RenderJob, get_sample_ladder,
+    set_render_samples, get_probe_percentage, get_pixel_noise,
+    apply_render_profile, clear_render_profile
+)
+from ..utils.generic import (
+    get_user_preferences, suppress_updates, RenderState
+)
+from ..utils.node import (
+    link_group_to_object, link_groups_beside_object, node_cleanup,
+    generate_switcher_tree, set_switcher_index, swap_linked_groups
+)
+from ..utils.compositor import (
+    get_pass_filepath, pass_output_setup, viewer_output_setup,
+    get_viewer_pixels, compositor_cleanup
+)
 from ..utils.scene import (
     camera_in_3d_view, is_scene_valid,
-    scene_setup, scene_cleanup, validate_scene
+    scene_setup, scene_rebuild, scene_cleanup, validate_scene
 )
 from ..utils.baker import (
     get_baker_collections, import_baker_textures, baker_setup,
     baker_cleanup, get_bakers, get_baker_by_index
 )
 from ..utils.pack import (
-    get_channel_paths, pack_image_channels, is_pack_maps_enabled
+    get_channel_path, pack_image_channels, is_pack_maps_enabled,
+    is_pack_channel, store_channel_pixels, get_channel_pixels, channel_buffers
+)
+from ..utils.session import (
+    get_bake_session, start_bake_session, end_bake_session
+)
+from ..utils.preset import (
+    get_preset_path, get_preset, set_property_values, set_baker_values
+)
+from ..utils.manifest import (
+    load_manifest, save_manifest, get_scene_fingerprint, get_baker_key,
+    get_baker_fingerprint, get_manifest_entry, is_baker_up_to_date
+)
+from ..utils.cache import (
+    get_render_key, get_cached_render, store_cached_render,
+    prune_render_cache, render_cache
 )
 
 
@@ -137,7 +174,7 @@ class GRABDOC_OT_refresh_setup(Operator):
         return GRABDOC_OT_baker_export_single.poll(context)
 
     def execute(self, context: Context):
-        scene_setup(self, context)
+        scene_rebuild(context)
         return {'FINISHED'}
 
 
@@ -201,8 +238,14 @@ class GRABDOC_OT_baker_export(Operator, UILayout):
     bl_label   = "Export Maps"
     bl_options = {'REGISTER', 'INTERNAL'}
 
+    force: BoolProperty(
+        description="Re-bake every enabled map, even if it is up to date",
+        options={'SKIP_SAVE'}
+    )
+
     progress_factor = 0.0
     map_type = ''
+    running: bool = False
 
     @classmethod
     def poll(cls, context: Context) -> bool:
@@ -212,10 +255,25 @@ class GRABDOC_OT_baker_export(Operator, UILayout):
         if context.scene.gd.preview_state:
             cls.poll_message_set("Cannot run while in Map Preview")
             return False
+        if cls.running:
+            cls.poll_message_set("An export is already running")
+            return False
+        if get_bake_session() is not None:
+            cls.poll_message_set(Error.BAKE_SESSION_ACTIVE)
+            return False
         return True
 
     @staticmethod
     def export(context: Context, suffix: str, path: str = None) -> str:
+        return run_render_job(
+            GRABDOC_OT_baker_export.render_export(context, suffix, path)
+        )
+
+    @staticmethod
+    def render_export(
+            context: Context, suffix: str, path: str = None
+        ) -> RenderJob:
+        """Render and write a bake map straight to its export path."""
         render = context.scene.render
         saved_path = render.filepath
 
@@ -227,11 +285,415 @@ class GRABDOC_OT_baker_export(Operator, UILayout):
 
         context.scene.camera = bpy.data.objects[Global.TRIM_CAMERA_NAME]
 
-        bpy.ops.render.render(write_still=True)
-        render.filepath = saved_path
+        try:
+            yield {'write_still': True}
+        finally:
+            render.filepath = saved_path
         return path
 
-    def execute(self, context: Context):
+    @staticmethod
+    def get_aov_groups(bakers: list[Baker]) -> list[list[Baker]]:
+        """Group AOV compatible bakers that can share a single render."""
+        groups: dict[tuple, list[Baker]] = {}
+        for baker in bakers:
+            if baker.is_denoised() or not baker.aov_setup():
+                baker.aov_cleanup()
+                continue
+            key = (baker.engine, baker.disable_filtering)
+            groups.setdefault(key, []).append(baker)
+        # NOTE: Single bakers gain nothing from the AOV path
+        for group in groups.values():
+            if len(group) == 1:
+                group[0].aov_cleanup()
+        return [group for group in groups.values() if len(group) > 1]
+
+    def export_aov(self, context: Context, bakers: list[Baker]) -> RenderJob:
+        """Render a group of bakers once, writing every map to a shader
+        AOV, then split the AOV passes into separate bake maps."""
+        scene      = context.scene
+        view_layer = context.view_layer
+
+        self.unlink_switcher()
+        for baker in bakers:
+            baker.setup()
+        # NOTE: Bakers share one render, use the highest sample count
+        render = scene.render
+        if render.engine == 'CYCLES':
+            scene.cycles.samples = max(b.samples_cycles for b in bakers)
+        else:
+            scene.eevee.taa_render_samples = max(b.samples for b in bakers)
+
+        aov_names = [baker.get_aov_name() for baker in bakers]
+        for aov_name in aov_names:
+            aov = view_layer.aovs.add()
+            aov.name = aov_name
+            aov.type = 'COLOR'
+
+        try:
+            node_trees = [baker.node_tree for baker in bakers[1:]]
+            for ob in get_rendered_objects():
+                sockets  = link_group_to_object(ob, bakers[0].node_tree)
+                sockets += link_groups_beside_object(ob, node_trees)
+                sockets = ", ".join(
+                    {s for baker in bakers for s in sockets
+                     if s in baker.REQUIRED_SOCKETS}
+                )
+                if not sockets:
+                    continue
+                self.report(
+                    {'WARNING'}, f"{ob.name}: {sockets} {Error.MISSING_LINKS}"
+                )
+
+            passes = yield from self.render_passes(
+                context, aov_names + ['Alpha']
+            )
+        finally:
+            for aov in view_layer.aovs[:]:
+                if aov.name in aov_names:
+                    view_layer.aovs.remove(aov)
+            for baker in bakers:
+                baker.cleanup()
+                baker.aov_cleanup()
+            node_cleanup()
+
+        # Split passes into maps
+        use_alpha = render.image_settings.color_mode == 'RGBA'
+        for baker in bakers:
+            pixels = passes[baker.get_aov_name()]
+            pixels[3::4] = passes['Alpha'][0::4] if use_alpha else 1
+            self.save_map(context, baker, pixels)
+
+    @staticmethod
+    def get_native_groups(bakers: list[Baker]) -> list[list[Baker]]:
+        """Group bakers that can be exported from the same native pass render."""
+        groups: list[list[Baker]] = []
+        for baker in bakers:
+            if not baker.NATIVE_PASSES or baker.is_denoised():
+                continue
+            for group in groups:
+                if all(baker.shares_native_render(other) \
+                       and other.shares_native_render(baker) for other in group):
+                    group.append(baker)
+                    break
+            else:
+                groups.append([baker])
+        return groups
+
+    def export_native(self, context: Context, bakers: list[Baker]) -> RenderJob:
+        """Render a group of geometry bakers once using built-in Cycles
+        passes, leaving every material untouched, and convert the
+        passes into bake maps."""
+        scene      = context.scene
+        view_layer = context.view_layer
+        self.unlink_switcher()
+
+        native_state = RenderState(context, {
+            'view_layer': ('use_pass_z', 'use_pass_normal',
+                           'use_pass_ambient_occlusion'),
+            'scene.world.light_settings': ('distance',)
+        })
+        try:
+            with native_state:
+                for baker in bakers:
+                    baker.setup()
+                    baker.native_setup()
+                scene.render.engine = 'CYCLES'
+                scene.cycles.samples = max(b.samples_cycles for b in bakers)
+                # NOTE: Bakers may use another engine for their own renders
+                apply_render_profile(context, Baker.RENDER_PROFILE)
+
+                passes = {'Alpha'}
+                for baker in bakers:
+                    passes.update(baker.NATIVE_PASSES)
+                view_layer.use_pass_z                 = 'Depth'  in passes
+                view_layer.use_pass_normal            = 'Normal' in passes
+                view_layer.use_pass_ambient_occlusion = 'AO'     in passes
+                passes = yield from self.render_passes(context, list(passes))
+        finally:
+            clear_render_profile()
+            for baker in bakers:
+                baker.cleanup()
+
+        for idx, baker in enumerate(bakers):
+            pixels = baker.process_native_passes(passes)
+            if scene.render.image_settings.color_mode != 'RGBA':
+                pixels[3::4] = 1
+            self.save_map(context, baker, pixels)
+            del pixels
+            # NOTE: Free passes no remaining baker converts
+            required = {'Alpha'}.union(
+                *(other.NATIVE_PASSES for other in bakers[idx+1:])
+            )
+            for pass_name in list(passes):
+                if pass_name not in required:
+                    del passes[pass_name]
+
+    def unlink_switcher(self) -> None:
+        """Restore the materials linked to the switcher,
+        the next switched baker links them again."""
+        if self.switcher_sockets is None:
+            return
+        node_cleanup()
+        self.switcher_sockets = None
+
+    def link_switcher(self, baker: Baker) -> dict[str, list[str]]:
+        """Link the switcher to every rendered object on first
+        use, then select the given baker in the switcher.
+
+        Returns unlinked socket names for each object."""
+        if self.switcher_sockets is None:
+            self.switcher_sockets = {
+                ob.name: link_group_to_object(ob, self.switcher)
+                for ob in get_rendered_objects()
+            }
+        set_switcher_index(self.switcher, self.switched_bakers.index(baker))
+        return self.switcher_sockets
+
+    def export_baker(self, context: Context, baker: Baker) -> RenderJob:
+        """Link a single baker to every rendered object and export it."""
+        baker.setup()
+        switched = self.switcher is not None and baker in self.switched_bakers
+        use_cache = context.scene.gd.use_render_cache
+        try:
+            if switched:
+                unlinked = self.link_switcher(baker)
+            else:
+                self.unlink_switcher()
+                # TODO: Fix StructRNA issue to avoid recalculating
+                # constantly, may need to change GD object generation
+                unlinked = {
+                    ob.name: link_group_to_object(ob, baker.node_tree)
+                    for ob in get_rendered_objects()
+                }
+            for ob_name, sockets in unlinked.items():
+                sockets = baker.filter_sockets(sockets)
+                if not sockets:
+                    continue
+                self.report(
+                    {'WARNING'}, f"{ob_name}: {sockets} {Error.MISSING_LINKS}"
+                )
+
+            if use_cache:
+                # NOTE: Render neutral pixels and grade them afterwards
+                # so tonal changes re-export without rendering
+                baker.tonal_setup()
+                render_key = get_render_key(baker, self.scene_fingerprint)
+                pixels = get_cached_render(baker, render_key)
+                if pixels is None:
+                    pixels = yield from self.render_baker(
+                        context, baker, in_memory=True
+                    )
+                    store_cached_render(
+                        baker, self.scene_fingerprint, render_key, pixels
+                    )
+                pixels = baker.grade_pixels(pixels)
+            else:
+                pixels = yield from self.render_baker(context, baker)
+                if pixels is None:
+                    return
+            if context.scene.render.image_settings.color_mode != 'RGBA':
+                pixels[3::4] = 1
+            self.save_map(context, baker, pixels)
+        finally:
+            baker.cleanup()
+            if use_cache and baker.TONAL_PROPERTIES:
+                baker.node_update(context)
+            if baker.node_tree and not switched:
+                node_cleanup()
+
+    def render_baker(
+            self, context: Context, baker: Baker, in_memory: bool=False
+        ) -> RenderJob:
+        """Render a linked baker, returning its pixels or None
+        if the map was written straight to its export path."""
+        if context.scene.gd.use_auto_samples:
+            yield from self.probe_samples(context, baker)
+
+        denoise = baker.is_denoised()
+        if is_tiled_render():
+            pixels = yield from render_tiled(
+                lambda: self.render_viewer(context, denoise)
+            )
+        elif is_pack_channel(baker) or denoise or in_memory:
+            # NOTE: Keep packed maps in memory instead of re-reading
+            # them, denoised maps are only available in the compositor
+            pixels = yield from self.render_viewer(context, denoise)
+        else:
+            yield from self.render_export(context, baker.suffix)
+            return None
+        return pixels['Image']
+
+    @staticmethod
+    def probe_samples(context: Context, baker: Baker) -> RenderJob:
+        """Render low resolution probes with increasing sample counts and
+        apply the fewest samples whose result stays within the noise
+        target of the next probe, e.g. a single sample for flat maps."""
+        scene  = context.scene
+        render = scene.render
+        maximum = {'CYCLES':            baker.samples_cycles,
+                   'BLENDER_WORKBENCH': baker.samples_workbench}
+        ladder = get_sample_ladder(
+            render.engine, maximum.get(render.engine, baker.samples)
+        )
+        if len(ladder) < 2:
+            return
+        denoise = baker.is_denoised()
+
+        samples = ladder[-1]
+        saved_percentage = render.resolution_percentage
+        render.resolution_percentage = get_probe_percentage(scene)
+        try:
+            set_render_samples(scene, ladder[0])
+            reference = (yield from GRABDOC_OT_baker_export.render_viewer(
+                context, denoise
+            ))['Image']
+            for lower, higher in zip(ladder, ladder[1:]):
+                set_render_samples(scene, higher)
+                pixels = (yield from GRABDOC_OT_baker_export.render_viewer(
+                    context, denoise
+                ))['Image']
+                if get_pixel_noise(reference, pixels) \
+                <= scene.gd.auto_sample_noise:
+                    samples = lower
+                    break
+                reference = pixels
+        finally:
+            render.resolution_percentage = saved_percentage
+            set_render_samples(scene, samples)
+
+    @staticmethod
+    def render_passes(context: Context, passes: list[str]) -> RenderJob:
+        """Render the scene once and read back the given render passes."""
+        saved_state = pass_output_setup(context, passes)
+        context.scene.camera = bpy.data.objects[Global.TRIM_CAMERA_NAME]
+
+        def render_tile() -> RenderJob:
+            yield {}
+            pixels = {}
+            for pass_name in passes:
+                pass_path = get_pass_filepath(pass_name)
+                pixels[pass_name] = load_image_pixels(pass_path)
+                os.remove(pass_path)
+            return pixels
+
+        try:
+            if is_tiled_render():
+                pixels = yield from render_tiled(render_tile)
+            else:
+                pixels = yield from render_tile()
+        finally:
+            compositor_cleanup(context, saved_state)
+        return pixels
+
+    @staticmethod
+    def render_viewer(context: Context, denoise: bool=False) -> RenderJob:
+        """Render the trim camera and read the linear
+        result back from the compositor `Viewer Node`."""
+        saved_state = viewer_output_setup(context, denoise)
+        context.scene.camera = bpy.data.objects[Global.TRIM_CAMERA_NAME]
+        try:
+            yield {}
+            pixels = get_viewer_pixels()
+        finally:
+            compositor_cleanup(context, saved_state)
+        return {'Image': pixels}
+
+    @staticmethod
+    def save_map(
+            context: Context, baker: Baker, pixels: numpy.ndarray,
+            path: str = None
+        ) -> str:
+        """Write the pixels of a bake map using its color management.
+
+        Maps written to a custom `path` aren't kept for packing."""
+        set_color_management(baker.VIEW_TRANSFORM,
+                             baker.contrast.replace('_', ' '))
+        render = context.scene.render
+        name = f"{context.scene.gd.filename}_{baker.suffix}"
+        filepath = os.path.join(path or get_filepath(), name + get_format())
+        save_image_pixels(
+            pixels, filepath, (render.resolution_x, render.resolution_y)
+        )
+        if path is None:
+            store_channel_pixels(baker, pixels)
+        return filepath
+
+    def get_export_jobs(
+            self, context: Context, bakers: list[Baker]
+        ) -> list[tuple[list[Baker], RenderJob]]:
+        """Get the render jobs of every baker, batching bakers
+        that can share a render together, ordered by render engine."""
+        gd = context.scene.gd
+        jobs = []
+        batched_bakers = []
+        if gd.use_aov_export:
+            for group in self.get_aov_groups(bakers):
+                jobs.append((self.get_engine(group[0]), group,
+                             self.export_aov(context, group)))
+                batched_bakers += group
+        if gd.use_native_passes:
+            unbatched = [b for b in bakers if b not in batched_bakers]
+            for group in self.get_native_groups(unbatched):
+                jobs.append(('CYCLES', group,
+                             self.export_native(context, group)))
+                batched_bakers += group
+        bakers = [baker for baker in bakers if baker not in batched_bakers]
+
+        # NOTE: Pre-wire every remaining baker into a single switcher
+        self.switcher         = None
+        self.switcher_sockets = None
+        self.switched_bakers  = [baker for baker in bakers if baker.node_tree]
+        if gd.use_switcher_export and len(self.switched_bakers) > 1:
+            self.switcher = generate_switcher_tree(
+                [baker.node_tree for baker in self.switched_bakers]
+            )
+
+        for baker in bakers:
+            jobs.append((self.get_engine(baker), [baker],
+                         self.export_baker(context, baker)))
+        return self.schedule_jobs(context, jobs)
+
+    @staticmethod
+    def get_engine(baker: Baker) -> str:
+        return str(baker.engine).upper()
+
+    @staticmethod
+    def schedule_jobs(
+            context: Context, jobs: list[tuple[str, list[Baker], RenderJob]]
+        ) -> list[tuple[list[Baker], RenderJob]]:
+        """Order jobs to switch render engines as few times as possible,
+        starting with the current engine and rendering Cycles last.
+
+        Consecutive Cycles jobs keep their scene data resident."""
+        current_engine = context.scene.render.engine
+        engines = sorted(
+            dict.fromkeys(engine for engine, _bakers, _job in jobs),
+            key=lambda engine: (engine == 'CYCLES', engine != current_engine)
+        )
+        scheduled = []
+        for engine in engines:
+            # NOTE: Keeps batched jobs ahead of switched jobs, see
+            # `get_export_jobs`, batches also unlink the switcher
+            engine_jobs = [(bakers, job) for job_engine, bakers, job in jobs
+                           if job_engine == engine]
+            if engine == 'CYCLES' and len(engine_jobs) > 1:
+                persistent_job = GRABDOC_OT_baker_export.persistent_job
+                engine_jobs = [(bakers, persistent_job(context, job))
+                               for bakers, job in engine_jobs]
+            scheduled += engine_jobs
+        return scheduled
+
+    @staticmethod
+    def persistent_job(context: Context, job: RenderJob) -> RenderJob:
+        """Run a render job with Cycles persistent data, keeping geometry
+        and BVH resident so only shaders change between passes."""
+        context.scene.render.use_persistent_data = True
+        return (yield from job)
+
+    def export_setup(self, context: Context) -> set[str] | None:
+        """Validate the scene and prepare the export jobs.
+
+        Returns an operator result if there is nothing to export."""
         gd = context.scene.gd
         report_value, report_string = validate_scene(context)
         if report_value:
@@ -249,73 +711,253 @@ class GRABDOC_OT_baker_export(Operator, UILayout):
             return {'CANCELLED'}
 
         self.map_type = 'export'
+        channel_buffers.clear()
 
-        start = time.time()
-        context.window_manager.progress_begin(0, 9999)
-        completion_step = 100 / (1 + len(bakers))
-        completion_percent = 0
+        self.start = time.time()
 
-        saved_properties = baker_setup(context)
+        self.scene_fingerprint = None
+        if gd.use_incremental_export or gd.use_render_cache:
+            self.scene_fingerprint = \
+                get_scene_fingerprint(get_rendered_objects())
+        if gd.use_render_cache:
+            prune_render_cache(self.scene_fingerprint)
+        else:
+            render_cache.clear()
+
+        # Skip maps exported with identical inputs
+        self.fingerprints = {}
+        if gd.use_incremental_export:
+            manifest = {} if self.force else load_manifest()
+            for baker in bakers[:]:
+                fingerprint = get_baker_fingerprint(
+                    baker, self.scene_fingerprint
+                )
+                if is_baker_up_to_date(baker, fingerprint, manifest):
+                    bakers.remove(baker)
+                    continue
+                self.fingerprints.update(get_manifest_entry(baker, fingerprint))
+            if not bakers:
+                self.report({'INFO'}, Error.MAPS_UP_TO_DATE)
+                return {'FINISHED'}
+
+        self.bakers          = bakers
+        self.exported_bakers = []
+        self.job_bakers      = []
+        self.sample_progress = 0.0
+        self.sample_text     = ""
+        context.window_manager.progress_begin(0, 100)
+
+        self.saved_properties = baker_setup(context)
 
-        active_selected = False
+        self.switcher        = None
+        self.active_callback = None
         if context.object:
-            activeCallback = context.object.name
-            modeCallback = context.object.mode
+            self.active_callback = context.object.name
+            self.mode_callback = context.object.mode
             if bpy.ops.object.mode_set.poll():
                 bpy.ops.object.mode_set(mode='OBJECT')
-            active_selected = True
 
         # Scale up BG Plane (helps overscan & border pixels)
         plane_ob = bpy.data.objects[Global.BG_PLANE_NAME]
         plane_ob.scale[0] = plane_ob.scale[1] = 3
 
-        for baker in bakers:
-            baker.setup()
-            # TODO: Fix StructRNA issue to avoid recalculating
-            # constantly, may need to change GD object generation
-            for ob in get_rendered_objects():
-                sockets = link_group_to_object(ob, baker.node_tree)
-                sockets = baker.filter_sockets(sockets)
-                if not sockets:
-                    continue
-                self.report(
-                    {'WARNING'}, f"{ob.name}: {sockets} {Error.MISSING_LINKS}"
-                )
-
-            self.export(context, baker.suffix)
-            baker.cleanup()
-            if baker.node_tree:
-                node_cleanup()
+        try:
+            self.jobs = self.get_export_jobs(context, bakers)
+        except Exception:
+            self.export_cleanup(context, cancelled=True)
+            raise
+        type(self).running = True
+        return None
+
+    def export_cleanup(self, context: Context, cancelled: bool=False) -> None:
+        """Reimport textures and restore the scene after exporting."""
+        gd = context.scene.gd
 
-            completion_percent += completion_step
-            context.window_manager.progress_update(completion_percent)
+        if self.switcher is not None:
+            node_cleanup()
+            bpy.data.node_groups.remove(self.switcher)
+            self.switcher = None
+        # NOTE: AOV jobs that never ran leave their AOV nodes behind
+        for baker in self.bakers:
+            baker.aov_cleanup()
 
         # Reimport textures to render result material
-        bakers_to_reimport = [baker for baker in bakers if baker.reimport]
+        bakers_to_reimport = \
+            [baker for baker in self.exported_bakers if baker.reimport]
         if bakers_to_reimport:
             import_baker_textures(bakers_to_reimport)
 
         # Refresh all original settings
-        baker_cleanup(context, saved_properties)
+        baker_cleanup(context, self.saved_properties)
+
+        exported_keys = {get_baker_key(baker) for baker in self.exported_bakers}
+        fingerprints = {key: entry for key, entry in self.fingerprints.items()
+                        if key in exported_keys}
+        if fingerprints:
+            save_manifest(fingerprints)
 
         plane_ob = bpy.data.objects[Global.BG_PLANE_NAME]
         plane_ob.scale[0] = plane_ob.scale[1] = 1
 
-        if active_selected:
-            context.view_layer.objects.active = bpy.data.objects[activeCallback]
+        if self.active_callback is not None:
+            context.view_layer.objects.active = \
+                bpy.data.objects[self.active_callback]
             if bpy.ops.object.mode_set.poll():
-                bpy.ops.object.mode_set(mode=modeCallback)
+                bpy.ops.object.mode_set(mode=self.mode_callback)
 
-        elapsed = round(time.time() - start, 2)
+        context.window_manager.progress_end()
+        type(self).running = False
+        if cancelled:
+            self.report({'WARNING'}, Error.EXPORT_CANCELLED)
+            return
+
+        elapsed = round(time.time() - self.start, 2)
         self.report(
             {'INFO'}, f"{Error.EXPORT_COMPLETE} (execution time: {elapsed}s)"
         )
-        context.window_manager.progress_end()
-
         if gd.use_pack_maps is True:
             bpy.ops.grabdoc.baker_pack()
+
+    def update_progress(self, context: Context) -> None:
+        """Report per-baker and per-sample export progress."""
+        total = len(self.bakers)
+        done  = len(self.exported_bakers) \
+              + self.sample_progress * len(self.job_bakers)
+        context.window_manager.progress_update(100 * done / total)
+        if context.workspace is None or not self.job_bakers:
+            return
+        names = ", ".join(baker.get_display_name() for baker in self.job_bakers)
+        text = f"GrabDoc: Exporting {names} " \
+               f"({len(self.exported_bakers) + 1}/{total})"
+        if self.sample_text:
+            text += f"  |  {self.sample_text}"
+        context.workspace.status_text_set(text + "  |  [ESC] to cancel")
+
+    def execute(self, context: Context):
+        result = self.export_setup(context)
+        if result is not None:
+            return result
+        try:
+            for job_bakers, job in self.jobs:
+                self.job_bakers = job_bakers
+                run_render_job(job)
+                self.exported_bakers += job_bakers
+                self.update_progress(context)
+        except Exception:
+            self.export_cleanup(context, cancelled=True)
+            raise
+        self.export_cleanup(context)
+        return {'FINISHED'}
+
+    def invoke(self, context: Context, _event: Event):
+        result = self.export_setup(context)
+        if result is not None:
+            return result
+        self.job = None
+        self.rendering = self.render_done = self.render_cancelled = False
+
+        handlers = bpy.app.handlers
+        handlers.render_complete.append(self.on_render_complete)
+        handlers.render_cancel.append(self.on_render_cancel)
+        handlers.render_stats.append(self.on_render_stats)
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context: Context, event: Event):
+        # NOTE: While rendering, ESC is handled by the render job
+        if event.type == 'ESC' and not self.rendering:
+            return self.cancel(context)
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        if self.rendering:
+            if self.render_cancelled:
+                return self.cancel(context)
+            if not self.render_done:
+                self.update_progress(context)
+                return {'PASS_THROUGH'}
+            self.rendering = False
+
+        try:
+            rendering = self.start_next_render(context)
+        except Exception:
+            self.cancel(context)
+            raise
+        if rendering:
+            self.update_progress(context)
+            return {'PASS_THROUGH'}
+        self.remove_handlers(context)
+        self.export_cleanup(context)
         return {'FINISHED'}
 
+    def start_next_render(self, context: Context) -> bool:
+        """Advance the export jobs until the next render is started.
+
+        Returns False once every job is finished."""
+        while True:
+            if self.job is None:
+                if not self.jobs:
+                    return False
+                self.job_bakers, self.job = self.jobs.pop(0)
+            try:
+                request = self.job.send(None)
+            except StopIteration:
+                self.exported_bakers += self.job_bakers
+                self.job = None
+                self.sample_progress = 0.0
+                self.sample_text = ""
+                continue
+            self.render_done = self.render_cancelled = False
+            self.rendering = True
+            result = bpy.ops.render.render('INVOKE_DEFAULT', **request)
+            if 'CANCELLED' in result:
+                self.render_cancelled = True
+            self.update_progress(context)
+            return True
+
+    def cancel(self, context: Context):
+        """Stop the export, running every pending cleanup step."""
+        if self.job is not None:
+            self.job.close()
+            self.job = None
+        for _job_bakers, job in self.jobs:
+            job.close()
+        self.jobs.clear()
+        self.remove_handlers(context)
+        self.export_cleanup(context, cancelled=True)
+        return {'CANCELLED'}
+
+    def remove_handlers(self, context: Context) -> None:
+        handlers = bpy.app.handlers
+        for handler_list, handler in (
+                (handlers.render_complete, self.on_render_complete),
+                (handlers.render_cancel,   self.on_render_cancel),
+                (handlers.render_stats,    self.on_render_stats)
+            ):
+            if handler in handler_list:
+                handler_list.remove(handler)
+        context.window_manager.event_timer_remove(self._timer)
+        if context.workspace is not None:
+            context.workspace.status_text_set(None)
+
+    def on_render_complete(self, *_args) -> None:
+        self.render_done = True
+
+    def on_render_cancel(self, *_args) -> None:
+        self.render_cancelled = True
+
+    def on_render_stats(self, *args) -> None:
+        stats = next((arg for arg in args if isinstance(arg, str)), "")
+        match = re.search(r"Sample (\d+)\s*/\s*(\d+)", stats) \
+             or re.search(r"(\d+)\s*/\s*(\d+) [Ss]amples", stats)
+        if match is None:
+            return
+        current, total = (int(value) for value in match.groups())
+        self.sample_progress = current / max(total, 1)
+        self.sample_text = f"Sample {current}/{total}"
+
 
 class GRABDOC_OT_baker_export_single(Operator):
     """Render the selected bake map and preview it within Blender.
@@ -333,6 +975,9 @@ Rendering a second time will overwrite the internal image"""
         if context.scene.gd.preview_state:
             cls.poll_message_set("Cannot do this while in Map Preview")
             return False
+        if GRABDOC_OT_baker_export.running:
+            cls.poll_message_set("Cannot do this while exporting")
+            return False
         return True
 
     def open_render_image(self, filepath: str):
@@ -358,38 +1003,61 @@ Rendering a second time will overwrite the internal image"""
             if bpy.ops.object.mode_set.poll():
                 bpy.ops.object.mode_set(mode='OBJECT')
 
-        plane_ob = bpy.data.objects[Global.BG_PLANE_NAME]
-        plane_ob.scale[0] = plane_ob.scale[1] = 3
-
-        saved_properties = baker_setup(context)
-
         gd = context.scene.gd
         self.baker = getattr(gd, self.map_type)[self.baker_index]
-        self.baker.setup()
-        if self.baker.node_tree:
-            for ob in get_rendered_objects():
-                sockets = link_group_to_object(ob, self.baker.node_tree)
-                sockets = self.baker.filter_sockets(sockets)
-                if not sockets:
-                    continue
-                self.report({'WARNING'},
-                            f"{ob.name}: {sockets} {Error.MISSING_LINKS}")
-        path = GRABDOC_OT_baker_export.export(
-            context, self.baker.suffix, path=get_temp_path()
-        )
+
+        # NOTE: A bake session keeps setup and links between renders
+        session = get_bake_session()
+        if session is not None and session.scene != context.scene:
+            end_bake_session()
+            session = None
+        if session is None:
+            plane_ob = bpy.data.objects[Global.BG_PLANE_NAME]
+            plane_ob.scale[0] = plane_ob.scale[1] = 3
+            saved_properties = baker_setup(context)
+            self.baker.setup()
+            unlinked = {}
+            if self.baker.node_tree:
+                unlinked = {
+                    ob.name: link_group_to_object(ob, self.baker.node_tree)
+                    for ob in get_rendered_objects()
+                }
+        else:
+            unlinked = session.apply_baker(self.baker)
+        for ob_name, sockets in unlinked.items():
+            sockets = self.baker.filter_sockets(sockets)
+            if not sockets:
+                continue
+            self.report({'WARNING'},
+                        f"{ob_name}: {sockets} {Error.MISSING_LINKS}")
+
+        if self.baker.is_denoised():
+            # NOTE: Denoised maps are only available in the compositor
+            pixels = run_render_job(
+                GRABDOC_OT_baker_export.render_viewer(context, denoise=True)
+            )['Image']
+            if context.scene.render.image_settings.color_mode != 'RGBA':
+                pixels[3::4] = 1
+            path = GRABDOC_OT_baker_export.save_map(
+                context, self.baker, pixels, path=get_temp_path()
+            )
+        else:
+            path = GRABDOC_OT_baker_export.export(
+                context, self.baker.suffix, path=get_temp_path()
+            )
         self.open_render_image(path)
-        self.baker.cleanup()
-        if self.baker.node_tree:
-            node_cleanup()
+        if session is None:
+            self.baker.cleanup()
+            if self.baker.node_tree:
+                node_cleanup()
 
         # Reimport textures to render result material
         if self.baker.reimport:
             import_baker_textures([self.baker])
 
-        baker_cleanup(context, saved_properties)
-
-        plane_ob = bpy.data.objects[Global.BG_PLANE_NAME]
-        plane_ob.scale[0] = plane_ob.scale[1] = 1
+        if session is None:
+            baker_cleanup(context, saved_properties)
+            plane_ob.scale[0] = plane_ob.scale[1] = 1
 
         if activeCallback is not None:
             context.view_layer.objects.active = bpy.data.objects[activeCallback]
@@ -404,6 +1072,46 @@ Rendering a second time will overwrite the internal image"""
         return {'FINISHED'}
 
 
+class GRABDOC_OT_bake_session_start(Operator):
+    """Apply bake settings once and keep node groups
+    linked between single map renders until ended"""
+    bl_idname  = "grabdoc.bake_session_start"
+    bl_label   = "Start Bake Session"
+    bl_options = {'REGISTER', 'INTERNAL'}
+
+    @classmethod
+    def poll(cls, context: Context) -> bool:
+        if get_bake_session() is not None:
+            cls.poll_message_set(Error.BAKE_SESSION_ACTIVE)
+            return False
+        return GRABDOC_OT_baker_export_single.poll(context)
+
+    def execute(self, context: Context):
+        report_value, report_string = validate_scene(context, False)
+        if report_value:
+            self.report({'ERROR'}, report_string)
+            return {'CANCELLED'}
+        if bpy.ops.object.mode_set.poll():
+            bpy.ops.object.mode_set(mode='OBJECT')
+        start_bake_session(context)
+        return {'FINISHED'}
+
+
+class GRABDOC_OT_bake_session_end(Operator):
+    """End the Bake Session, unlinking node groups and restoring the scene"""
+    bl_idname  = "grabdoc.bake_session_end"
+    bl_label   = "End Bake Session"
+    bl_options = {'REGISTER', 'INTERNAL'}
+
+    @classmethod
+    def poll(cls, _context: Context) -> bool:
+        return get_bake_session() is not None
+
+    def execute(self, _context: Context):
+        end_bake_session()
+        return {'FINISHED'}
+
+
 class GRABDOC_OT_baker_preview_exit(Operator):
     """Exit the current Map Preview"""
     bl_idname  = "grabdoc.baker_preview_exit"
@@ -458,16 +1166,31 @@ class GRABDOC_OT_baker_preview(Operator):
     bl_label   = ""
     bl_options = {'REGISTER', 'UNDO', 'INTERNAL'}
 
-    baker_index:    IntProperty()
-    map_type:       StringProperty()
-    last_ob_amount: int  = 0
-    disable_binds:  bool = False
+    baker_index:   IntProperty()
+    map_type:      StringProperty()
+    disable_binds: bool = False
+
+    # NOTE: Running preview, used to switch bakers in place
+    active = None
+
+    # NOTE: Format properties re-applied through the message bus
+    FORMAT_PROPERTIES = ('format', 'depth', 'exr_depth',
+                         'coll_rendered', 'use_transparent')
 
     def modal(self, context: Context, event: Event):
-        scene = context.scene
+        # NOTE: Format, new objects and scene validity are
+        # handled by subscriptions, keep per event work minimal
+        if not context.scene.gd.preview_state \
+        or not self.scene_valid \
+        or (event.type == 'ESC' and self.disable_binds):
+            self.cleanup(context)
+            return {'CANCELLED'}
+        return {'PASS_THROUGH'}
+
+    def apply_format(self) -> None:
+        scene = bpy.context.scene
         gd    = scene.gd
 
-        # Format
         # NOTE: Set alpha channel if background plane not visible in render
         image_settings = scene.render.image_settings
         if not gd.coll_rendered or gd.use_transparent:
@@ -483,25 +1206,57 @@ class GRABDOC_OT_baker_preview(Operator):
         elif gd.format != 'TARGA':
             image_settings.color_depth = gd.depth
 
-        # Handle newly added object materials
-        ob_amount = len(bpy.data.objects)
-        if  ob_amount > self.last_ob_amount \
-        and self.baker and self.baker.node_tree:
-            link_group_to_object(context.object, self.baker.node_tree)
-        self.last_ob_amount = ob_amount
-
-        # Exit check
-        if not gd.preview_state \
-        or (event.type in {'ESC'} and self.disable_binds) \
-        or not is_scene_valid():
-            self.cleanup(context)
-            return {'CANCELLED'}
-        return {'PASS_THROUGH'}
+    def add_handlers(self, context: Context) -> None:
+        self.msgbus_owner = object()
+        # NOTE: Timers are matched by identity, keep one bound method
+        self.link_timer = self.link_new_objects
+        gd = context.scene.gd
+        for name in self.FORMAT_PROPERTIES:
+            bpy.msgbus.subscribe_rna(
+                key=gd.path_resolve(name, False), owner=self.msgbus_owner,
+                args=(), notify=self.apply_format
+            )
+        bpy.app.handlers.depsgraph_update_post.append(self.on_depsgraph_update)
+
+    def remove_handlers(self) -> None:
+        bpy.msgbus.clear_by_owner(self.msgbus_owner)
+        handlers = bpy.app.handlers.depsgraph_update_post
+        if self.on_depsgraph_update in handlers:
+            handlers.remove(self.on_depsgraph_update)
+        if bpy.app.timers.is_registered(self.link_timer):
+            bpy.app.timers.unregister(self.link_timer)
+
+    def on_depsgraph_update(self, _scene, depsgraph) -> None:
+        """Queue objects the preview hasn't seen yet, e.g.
+        added or duplicated, and track scene validity."""
+        for update in depsgraph.updates:
+            if isinstance(update.id, bpy.types.Scene):
+                self.scene_valid = is_scene_valid()
+            if not isinstance(update.id, bpy.types.Object) \
+            or update.id.name in self.known_objects:
+                continue
+            self.new_objects.add(update.id.name)
+        if self.new_objects \
+        and not bpy.app.timers.is_registered(self.link_timer):
+            bpy.app.timers.register(self.link_timer)
+
+    def link_new_objects(self) -> None:
+        """Link all queued objects in one batch, outside of the depsgraph."""
+        self.known_objects.update(self.new_objects)
+        new_objects, self.new_objects = self.new_objects, set()
+        if not bpy.context.scene.gd.preview_state \
+        or not self.baker.node_tree:
+            return
+        for ob in get_rendered_objects():
+            if ob.name in new_objects:
+                link_group_to_object(ob, self.baker.node_tree)
 
     def cleanup(self, context: Context) -> None:
         context.scene.gd.preview_state = False
+        GRABDOC_OT_baker_preview.active = None
 
         SpaceView3D.draw_handler_remove(self._handle, 'WINDOW')
+        self.remove_handlers()
 
         self.baker.cleanup()
         if self.baker.node_tree:
@@ -528,17 +1283,19 @@ class GRABDOC_OT_baker_preview(Operator):
 
         self.user_preferences = get_user_preferences()
 
+        end_bake_session()
         gd = context.scene.gd
         self.saved_properties = baker_setup(context)
-        # TODO: Necessary to save?
-        self.saved_properties['bpy.context.scene.gd.engine'] = gd.engine
 
         gd.preview_state    = True
         gd.preview_map_type = self.map_type
         gd.engine           = 'grabdoc'
 
-        self.last_ob_amount = len(bpy.data.objects)
         self.disable_binds = not self.user_preferences.disable_preview_binds
+        self.scene_valid   = True
+        self.known_objects = set(bpy.data.objects.keys())
+        self.new_objects   = set()
+        self.apply_format()
 
         if bpy.ops.object.mode_set.poll():
             bpy.ops.object.mode_set(mode='OBJECT')
@@ -555,21 +1312,32 @@ class GRABDOC_OT_baker_preview(Operator):
         if not camera_in_3d_view():
             bpy.ops.view3d.view_camera()
 
+        # NOTE: Render state shared by all bakers, restored when switching
+        self.preview_properties = RenderState(context).capture()
+
         gd.preview_index = self.baker_index
         baker_prop = getattr(gd, self.map_type)
         self.baker = get_baker_by_index(baker_prop, self.baker_index)
         self.baker.setup()
-
-        self.preview_name = self.map_type
-        if self.baker.ID == 'custom':
-            self.preview_name = self.baker.suffix.capitalize()
+        self.set_preview_name()
+        GRABDOC_OT_baker_preview.active = self
         self._handle = SpaceView3D.draw_handler_add(  # pylint: disable=E1120
             draw_callback_px, (self, context), 'WINDOW', 'POST_PIXEL'
         )
         context.window_manager.modal_handler_add(self)
+        self.add_handlers(context)
 
         if not self.baker.node_tree and self.baker.ID != 'custom':
             return {'RUNNING_MODAL'}
+        self.link_objects()
+        return {'RUNNING_MODAL'}
+
+    def set_preview_name(self) -> None:
+        self.preview_name = self.baker.ID
+        if self.baker.ID == 'custom':
+            self.preview_name = self.baker.suffix.capitalize()
+
+    def link_objects(self) -> None:
         for ob in get_rendered_objects():
             sockets = link_group_to_object(ob, self.baker.node_tree)
             sockets = self.baker.filter_sockets(sockets)
@@ -577,7 +1345,75 @@ class GRABDOC_OT_baker_preview(Operator):
                 continue
             self.report({'WARNING'},
                         f"{ob.name}: {sockets} {Error.MISSING_LINKS}")
-        return {'RUNNING_MODAL'}
+
+    def swap_baker(self, context: Context, baker: Baker) -> str:
+        """Switch the previewed baker without restoring the scene,
+        pointing the already linked group nodes at its node tree.
+
+        Returns formatted socket names without links."""
+        previous = self.baker
+        previous.cleanup()
+        self.preview_properties.restore()
+        self.apply_format()
+
+        gd = context.scene.gd
+        gd.preview_map_type = self.map_type = baker.ID
+        gd.preview_index    = self.baker_index = baker.index
+        self.baker = baker
+        baker.setup()
+        self.set_preview_name()
+
+        unlinked = None
+        if previous.node_tree and baker.node_tree:
+            unlinked = swap_linked_groups(baker.node_tree)
+        if unlinked is not None:
+            return baker.filter_sockets(unlinked)
+        if previous.node_tree:
+            node_cleanup()
+        if baker.node_tree or baker.ID == 'custom':
+            self.link_objects()
+        return ""
+
+
+# NOTE: Referenced to keep dynamic enum item strings alive
+preview_items: list[tuple[str, str, str]] = []
+
+
+def get_preview_items(_self, _context: Context) -> list[tuple[str, str, str]]:
+    preview_items.clear()
+    for baker in get_bakers():
+        if not baker.visibility:
+            continue
+        preview_items.append(
+            (f"{baker.ID}_{baker.index}", baker.get_display_name(), "")
+        )
+    return preview_items
+
+
+class GRABDOC_OT_baker_preview_swap(Operator):
+    """Switch Map Preview to another bake map without exiting"""
+    bl_idname   = "grabdoc.baker_preview_swap"
+    bl_label    = "Switch Preview"
+    bl_options  = {'REGISTER', 'INTERNAL'}
+    bl_property = "baker"
+
+    baker: EnumProperty(items=get_preview_items)
+
+    @classmethod
+    def poll(cls, context: Context) -> bool:
+        return context.scene.gd.preview_state \
+           and GRABDOC_OT_baker_preview.active is not None
+
+    def execute(self, context: Context):
+        map_type, index = self.baker.rsplit('_', maxsplit=1)
+        baker_prop = getattr(context.scene.gd, map_type)
+        baker = get_baker_by_index(baker_prop, int(index))
+        if baker is None:
+            return {'CANCELLED'}
+        sockets = GRABDOC_OT_baker_preview.active.swap_baker(context, baker)
+        if sockets:
+            self.report({'WARNING'}, f"{sockets} {Error.MISSING_LINKS}")
+        return {'FINISHED'}
 
 
 class GRABDOC_OT_baker_preview_export(Operator):
@@ -659,66 +1495,88 @@ class GRABDOC_OT_baker_pack(Operator):
     bl_options = {'REGISTER', 'INTERNAL'}
 
     def execute(self, context: Context):
-        # If a channel is unused, replace with blank image
         gd = context.scene.gd
         resolution = (gd.resolution_x, gd.resolution_y)
-        temp_image = bpy.data.images.new("_gd_pack_temp", *resolution)
+        channel_names = (gd.channel_r, gd.channel_g, gd.channel_b, gd.channel_a)
 
-        # Load images in blend
-        r, g, b, a = get_channel_paths()
-        if gd.channel_r != 'none':
-            image_r = bpy.data.images.load(r)
-        else:
-            image_r = temp_image
-        if gd.channel_g != 'none':
-            image_g = bpy.data.images.load(g)
-        else:
-            image_g = temp_image
-        if gd.channel_b != 'none':
-            image_b = bpy.data.images.load(b)
-        else:
-            image_b = temp_image
-        if gd.channel_a != 'none':
-            image_a = bpy.data.images.load(a)
-        else:
-            image_a = temp_image
+        # NOTE: Maps baked by the last export are packed from memory
+        channels = [get_channel_pixels(name) for name in channel_names]
+        channel_buffers.clear()
 
         # Pack and export
-        pack_order = [(image_r, (0, 0)),
-                      (image_g, (0, 1)),
-                      (image_b, (0, 2)),
-                      (image_a, (0, 3))]
-
         pack_name = gd.filename + "_" + gd.pack_name
-        dst_image = pack_image_channels(pack_order, pack_name, resolution)
+        dst_image = pack_image_channels(channels, pack_name, resolution)
         dst_image.filepath_raw = \
             get_filepath() + "//" + pack_name + get_format()
         dst_image.file_format  = gd.format
         dst_image.save()
-
-        # Remove internal images
-        if gd.channel_r != 'none':
-            bpy.data.images.remove(image_r)
-        if gd.channel_g != 'none':
-            bpy.data.images.remove(image_g)
-        if gd.channel_b != 'none':
-            bpy.data.images.remove(image_b)
-        if gd.channel_a != 'none':
-            bpy.data.images.remove(image_a)
         bpy.data.images.remove(dst_image)
-        bpy.data.images.remove(temp_image)
 
         # Remove packed images
         if gd.remove_original_maps is False:
             return {'FINISHED'}
-        if gd.channel_r != 'none' and os.path.exists(r):
-            os.remove(r)
-        if gd.channel_g != 'none' and os.path.exists(g):
-            os.remove(g)
-        if gd.channel_b != 'none' and os.path.exists(b):
-            os.remove(b)
-        if gd.channel_a != 'none' and os.path.exists(a):
-            os.remove(a)
+        for channel_name in channel_names:
+            filepath = get_channel_path(channel_name)
+            if filepath is not None:
+                os.remove(filepath)
+        return {'FINISHED'}
+
+
+class GRABDOC_OT_preset_add(Operator):
+    """Add or remove a bake preset"""
+    bl_idname  = "grabdoc.preset_add"
+    bl_label   = "Add a new preset"
+    bl_options = {'REGISTER', 'INTERNAL'}
+
+    name:        StringProperty(name="Name", options={'SKIP_SAVE'})
+    remove_name: BoolProperty(options={'HIDDEN', 'SKIP_SAVE'})
+
+    def execute(self, context: Context):
+        filename = bpy.path.clean_name(self.name.strip())
+        if not filename:
+            return {'CANCELLED'}
+        filepath = os.path.join(get_preset_path(), filename + ".json")
+        if self.remove_name:
+            if os.path.exists(filepath):
+                os.remove(filepath)
+            return {'FINISHED'}
+        with open(filepath, 'w', encoding='utf-8') as file:
+            json.dump(get_preset(context.scene.gd), file, indent=4)
+        return {'FINISHED'}
+
+
+class GRABDOC_OT_preset_load(Operator):
+    """Apply a bake preset, including every bake map instance"""
+    bl_idname  = "grabdoc.preset_load"
+    bl_label   = "Load Preset"
+    bl_options = {'REGISTER', 'UNDO', 'INTERNAL'}
+
+    filepath: StringProperty(subtype='FILE_PATH', options={'SKIP_SAVE'})
+
+    @classmethod
+    def poll(cls, context: Context) -> bool:
+        return GRABDOC_OT_baker_export_single.poll(context)
+
+    def execute(self, context: Context):
+        try:
+            with open(self.filepath, encoding='utf-8') as file:
+                preset = json.load(file)
+            properties, bakers = preset['properties'], preset['bakers']
+        except (OSError, ValueError, KeyError, TypeError):
+            self.report({'ERROR'}, Error.PRESET_INVALID)
+            return {'CANCELLED'}
+
+        gd = context.scene.gd
+        with suppress_updates():
+            for baker_cls in Baker.__subclasses__():
+                if baker_cls.ID in bakers:
+                    set_baker_values(getattr(gd, baker_cls.ID),
+                                     bakers[baker_cls.ID])
+            # NOTE: Pack channel items are generated from the bakers
+            init_baker_dependencies()
+            set_property_values(gd, properties)
+
+        scene_setup(self, context)
         return {'FINISHED'}
 
 
@@ -740,11 +1598,16 @@ classes = (
     GRABDOC_OT_baker_remove,
     GRABDOC_OT_baker_export,
     GRABDOC_OT_baker_export_single,
+    GRABDOC_OT_bake_session_start,
+    GRABDOC_OT_bake_session_end,
     GRABDOC_OT_baker_preview,
     GRABDOC_OT_baker_preview_exit,
+    GRABDOC_OT_baker_preview_swap,
     GRABDOC_OT_baker_preview_export,
     GRABDOC_OT_baker_visibility,
-    GRABDOC_OT_baker_pack
+    GRABDOC_OT_baker_pack,
+    GRABDOC_OT_preset_add,
+    GRABDOC_OT_preset_load
 )
 
 def register():
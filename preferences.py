@@ -2,9 +2,8 @@
 import os
 
 import bpy
-from bl_operators.presets import AddPresetBase
 from bl_ui.utils import PresetPanel
-from bpy.types import (Menu, Panel, Operator, AddonPreferences,
+from bpy.types import (Menu, Panel, AddonPreferences,
                        Context, PropertyGroup, Image, Scene,
                        Collection, Object, Node)
 from bpy.props import (BoolProperty, PointerProperty, CollectionProperty,
@@ -177,6 +176,76 @@ When disabled, pixel filtering is reduced to .01px""",
         name="Bake Groups", update=scene_setup
     )
 
+    # Performance
+    use_aov_export: BoolProperty(
+        description=\
+"""Render material maps (Roughness, Metallic, Base Color, Emissive, Custom)
+sharing the same engine in a single render using shader AOVs.
+
+Each AOV is then split into its own file""",
+        name="Single Render Material Maps", default=False
+    )
+    use_native_passes: BoolProperty(
+        description=\
+"""Export Normals, Occlusion, Height and Alpha maps from built-in Cycles passes
+in a single render without editing any materials.
+
+Bevel shader normals are not supported in this mode""",
+        name="Native Geometry Passes", default=False
+    )
+    use_switcher_export: BoolProperty(
+        description=\
+"""Link every enabled bake map into materials once per export using a
+shared switcher node group, instead of relinking materials for each map""",
+        name="Pre-Wired Materials", default=False
+    )
+    use_incremental_export: BoolProperty(
+        description=\
+"""Skip bake maps whose settings, objects and materials haven't changed
+since they were last exported. Fingerprints are stored next to the maps""",
+        name="Incremental Export", default=False
+    )
+    use_tiled_export: BoolProperty(
+        description=\
+"""Render large exports in tiles to bound render memory by the tile size.
+
+Tiles are stitched back together into a single map""",
+        name="Tiled Export", default=False
+    )
+    tile_size: IntProperty(
+        description="Maximum width and height of a single render tile",
+        name="Tile Size", default=4096, min=256, soft_max=8192, max=16384,
+        subtype='PIXEL'
+    )
+    tile_overlap: IntProperty(
+        description=\
+        "Extra pixels rendered around each tile, trimmed for seamless filtering",
+        name="Overlap", default=16, min=0, soft_max=64, max=256,
+        subtype='PIXEL'
+    )
+    use_auto_samples: BoolProperty(
+        description=\
+"""Probe each bake map at low resolution with increasing sample counts and
+bake with the fewest samples that meet the noise target.
+
+The bake map sample settings are used as the maximum.
+AOV and native pass batches always use the maximum""",
+        name="Auto Samples", default=False
+    )
+    auto_sample_noise: FloatProperty(
+        description=\
+        "Largest RMS pixel difference allowed between two sample counts",
+        name="Noise Target", default=.005, min=0, soft_max=.1, precision=4
+    )
+    use_render_cache: BoolProperty(
+        description=\
+"""Keep the last linear render of each bake map in memory.
+
+Changing only invert, flip Y or contrast re-exports
+the cached render without rendering again""",
+        name="Render Cache", default=False
+    )
+
     # Bake maps
     MAP_TYPES = [('none', "None", "")]
     baker_props = {}
@@ -229,42 +298,21 @@ When disabled, pixel filtering is reduced to .01px""",
 
 
 class GRABDOC_MT_presets(Menu):
-    bl_label        = ""
-    preset_subdir   = "gd"
-    preset_operator = "script.execute_preset"
-    draw            = Menu.draw_preset
+    bl_label          = ""
+    preset_subdir     = "grab_doc"
+    preset_operator   = "grabdoc.preset_load"
+    preset_extensions = {".json"}
+    draw              = Menu.draw_preset
 
 
 class GRABDOC_PT_presets(PresetPanel, Panel):
     bl_label            = 'Bake Presets'
     preset_subdir       = 'grab_doc'
-    preset_operator     = 'script.execute_preset'
+    preset_operator     = 'grabdoc.preset_load'
+    preset_extensions   = {".json"}
     preset_add_operator = 'grabdoc.preset_add'
 
 
-class GRABDOC_OT_add_preset(AddPresetBase, Operator):
-    bl_idname   = "grabdoc.preset_add"
-    bl_label    = "Add a new preset"
-    preset_menu = "GRABDOC_MT_presets"
-
-    preset_subdir  = "grab_doc"
-    preset_defines = ["gd=bpy.context.scene.gd"]
-    preset_values  = []
-    bakers         = [baker.ID for baker in Baker.__subclasses__()]
-    for name in GRABDOC_PG_properties.__annotations__.keys():
-        if name.startswith("preview_"):
-            continue
-        if name in bakers:
-            preset_values.append(f"gd.{name}[0]")
-            continue
-        preset_values.append(f"gd.{name}")
-
-    # TODO: Figure out a way to run init_baker_dependencies
-    #       in order to support multi-baker presets
-    #def execute(self, context: Context):
-    #    super().execute(context)
-
-
 ##################################
 # REGISTRATION
 ##################################
@@ -273,8 +321,7 @@ class GRABDOC_OT_add_preset(AddPresetBase, Operator):
 classes = [
     GRABDOC_AP_preferences,
     GRABDOC_MT_presets,
-    GRABDOC_PT_presets,
-    GRABDOC_OT_add_preset
+    GRABDOC_PT_presets
 ]
 # NOTE: Register properties last for collection generation
 classes.extend([*Baker.__subclasses__(), GRABDOC_PG_properties])
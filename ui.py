@@ -7,6 +7,7 @@ from .preferences import GRABDOC_PT_presets
 from .utils.baker import get_baker_by_index, get_baker_collections
 from .utils.generic import get_version, get_user_preferences
 from .utils.scene import camera_in_3d_view, is_scene_valid
+from .utils.session import get_bake_session
 
 
 class GDPanel(Panel):
@@ -195,6 +196,55 @@ class GRABDOC_PT_output(GDPanel):
             row.prop(gd, 'mt_auto_close', text='Close after Baking')
 
 
+class GRABDOC_PT_performance(GDPanel):
+    bl_label     = 'Performance'
+    bl_parent_id = "GRABDOC_PT_grabdoc"
+    bl_options   = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context: Context) -> bool:
+        if context.scene.gd.engine != 'grabdoc':
+            return False
+        return is_scene_valid()
+
+    def draw_header(self, _context: Context):
+        self.layout.label(icon='MOD_TIME')
+
+    def draw(self, context: Context):
+        gd = context.scene.gd
+        col = self.layout.column(align=True)
+        col.prop(gd, 'use_aov_export')
+        col.prop(gd, 'use_native_passes')
+        col.prop(gd, 'use_switcher_export')
+        row = col.row(align=True)
+        row.prop(gd, 'use_incremental_export')
+        if gd.use_incremental_export:
+            row.operator("grabdoc.baker_export", text="",
+                         icon='FILE_REFRESH').force = True
+        col.prop(gd, 'use_tiled_export')
+        if gd.use_tiled_export:
+            col = self.layout.column(align=True)
+            col.use_property_split    = True
+            col.use_property_decorate = False
+            col.prop(gd, 'tile_size')
+            col.prop(gd, 'tile_overlap')
+        col = self.layout.column(align=True)
+        col.prop(gd, 'use_auto_samples')
+        if gd.use_auto_samples:
+            col = self.layout.column(align=True)
+            col.use_property_split    = True
+            col.use_property_decorate = False
+            col.prop(gd, 'auto_sample_noise')
+        self.layout.prop(gd, 'use_render_cache')
+
+        row = self.layout.row(align=True)
+        if get_bake_session() is None:
+            row.operator("grabdoc.bake_session_start", icon='PLAY')
+        else:
+            row.alert = True
+            row.operator("grabdoc.bake_session_end", icon='PAUSE')
+
+
 class GRABDOC_PT_bake_maps(GDPanel):
     bl_label     = 'Maps'
     bl_parent_id = "GRABDOC_PT_grabdoc"
@@ -223,10 +273,17 @@ class GRABDOC_PT_bake_maps(GDPanel):
         row.scale_y = 1.5
         row.operator("grabdoc.baker_preview_exit", icon="CANCEL")
 
-        row = col.row(align=True)
-        row.scale_y = 1.1
         baker_prop = getattr(gd, gd.preview_map_type)
         baker = get_baker_by_index(baker_prop, gd.preview_index)
+        row = col.row(align=True)
+        row.scale_y = 1.1
+        row.operator_menu_enum(
+            "grabdoc.baker_preview_swap", "baker",
+            text=f"{baker.get_display_name()} Preview", icon="FILE_REFRESH"
+        )
+
+        row = col.row(align=True)
+        row.scale_y = 1.1
         row.operator(
             "grabdoc.baker_export_preview",
             text=f"Export {baker.NAME}", icon="EXPORT"
@@ -336,6 +393,7 @@ classes = [
     GRABDOC_PT_grabdoc,
     GRABDOC_PT_scene,
     GRABDOC_PT_output,
+    GRABDOC_PT_performance,
     GRABDOC_PT_bake_maps,
     GRABDOC_PT_pack_maps
 ]
@@ -8,29 +8,24 @@ from ..baker import Baker
 from ..constants import Global
 from .node import get_bsdf
 from .io import get_filepath, get_format
-from .generic import load_properties, save_properties
+from .generic import RenderState
+from .render import clear_render_profile
 
 
-def baker_setup(context: Context) -> dict:
-    """Baker scene bootstrapper."""
+def baker_setup(context: Context) -> RenderState:
+    """Baker scene bootstrapper.
+
+    Returns the render state captured before any changes."""
     scene            = context.scene
     gd               = scene.gd
     render           = scene.render
     eevee            = scene.eevee
     cycles           = scene.cycles
     view_layer       = context.view_layer
-    display          = scene.display
     shading          = scene.display.shading
-    view_settings    = scene.view_settings
-    display_settings = scene.display_settings
     image_settings   = render.image_settings
 
-    properties = (view_layer, render, eevee, cycles,
-                  shading, display, view_settings,
-                  display_settings, image_settings)
-    saved_properties = save_properties(properties)
-    saved_properties['bpy.context.scene.camera']       = scene.camera
-    saved_properties['bpy.context.scene.gd.reference'] = gd.reference
+    saved_properties = RenderState(context).capture()
 
     # Active Camera
     for area in context.screen.areas:
@@ -88,11 +83,10 @@ def baker_setup(context: Context) -> dict:
     return saved_properties
 
 
-def baker_cleanup(context: Context, properties: dict) -> None:
+def baker_cleanup(_context: Context, properties: RenderState) -> None:
     """Baker core cleanup, reverses any values changed by `baker_setup`."""
-    if context.scene.world:
-        context.scene.world.use_nodes = True
-    load_properties(properties)
+    clear_render_profile()
+    properties.restore()
 
 
 def get_baker_by_index(
@@ -0,0 +1,56 @@
+import hashlib
+
+import numpy # pylint: disable=E0401
+
+from ..baker import Baker
+from .manifest import update_rna_hash, update_node_tree_hash
+
+
+# NOTE: Last neutral linear render of each baker, kept between exports
+# and keyed by baker name, along with its scene fingerprint and render key
+render_cache: dict[str, tuple[str, str, numpy.ndarray]] = {}
+
+
+def get_cache_name(baker: Baker) -> str:
+    return f"{baker.ID}_{baker.index}"
+
+
+def get_render_key(baker: Baker, scene_fingerprint: str) -> str:
+    """Fingerprint everything changing the neutral render of a baker,
+    leaving out settings applied afterwards by `Baker.grade_pixels`
+    and the contrast look applied by color management on save.
+
+    Expects the baker node group to be neutral, see `Baker.tonal_setup`."""
+    hasher = hashlib.sha1(scene_fingerprint.encode())
+    hasher.update(baker.ID.encode())
+    update_rna_hash(
+        hasher, baker,
+        exclude=('enabled', 'visibility', 'reimport', 'suffix', 'contrast') \
+                + baker.get_tonal_properties()
+    )
+    if baker.node_tree:
+        update_node_tree_hash(hasher, baker.node_tree, set())
+    return hasher.hexdigest()
+
+
+def get_cached_render(baker: Baker, key: str) -> numpy.ndarray | None:
+    """Get the cached render of a baker if it was rendered with `key`."""
+    _scene_fingerprint, cached_key, pixels = \
+        render_cache.get(get_cache_name(baker), (None, None, None))
+    if cached_key != key:
+        return None
+    return pixels
+
+
+def store_cached_render(
+        baker: Baker, scene_fingerprint: str, key: str, pixels: numpy.ndarray
+    ) -> None:
+    render_cache[get_cache_name(baker)] = (scene_fingerprint, key, pixels)
+
+
+def prune_render_cache(scene_fingerprint: str) -> None:
+    """Free cached renders that can't match anymore, i.e. renders of
+    a different scene, resolution or output settings."""
+    for name, (cached_fingerprint, _key, _pixels) in list(render_cache.items()):
+        if cached_fingerprint != scene_fingerprint:
+            del render_cache[name]
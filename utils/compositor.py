@@ -0,0 +1,145 @@
+import os
+
+import numpy # pylint: disable=E0401
+
+import bpy
+from bpy.types import Context, Node
+
+from ..constants import Global
+from .io import get_temp_path
+
+
+def get_pass_path() -> str:
+    """Get the temporary directory used for split render passes."""
+    return os.path.join(get_temp_path(), "passes")
+
+
+def get_pass_filepath(pass_name: str) -> str:
+    """Get the path of a pass written by the GrabDoc `File Output` node."""
+    frame = bpy.context.scene.frame_current
+    return os.path.join(get_pass_path(), f"{pass_name}{frame:04d}.exr")
+
+
+def compositor_setup(context: Context) -> tuple[dict, Node]:
+    """Mute existing compositor nodes and add a GrabDoc `Render Layers` node.
+
+    Returns saved compositor state for `compositor_cleanup`
+    and the new `Render Layers` node."""
+    scene = context.scene
+    saved_state = {'use_nodes':       scene.use_nodes,
+                   'use_compositing': scene.render.use_compositing,
+                   'muted':           {}}
+    scene.use_nodes = True
+    scene.render.use_compositing = True
+
+    tree = scene.node_tree
+    for node in tree.nodes:
+        saved_state['muted'][node.name] = node.mute
+        node.mute = True
+
+    render_layers = tree.nodes.new('CompositorNodeRLayers')
+    render_layers.name     = Global.FLAG_PREFIX + "Render Layers"
+    render_layers.scene    = scene
+    render_layers.layer    = context.view_layer.name
+    render_layers.gd_spawn = True
+    return saved_state, render_layers
+
+
+def pass_output_setup(context: Context, passes: list[str]) -> dict:
+    """Route the given render layer passes to linear 32-bit
+    EXR files through a temporary compositor `File Output` node.
+
+    Existing compositor nodes are muted while rendering.
+
+    Returns saved compositor state for `compositor_cleanup`."""
+    saved_state, render_layers = compositor_setup(context)
+    tree = context.scene.node_tree
+
+    file_output = tree.nodes.new('CompositorNodeOutputFile')
+    file_output.name      = Global.FLAG_PREFIX + "File Output"
+    file_output.base_path = get_pass_path()
+    file_output.gd_spawn  = True
+    file_output.location  = (400, 0)
+    file_output.format.file_format = 'OPEN_EXR'
+    file_output.format.color_depth = '32'
+    file_output.format.color_mode  = 'RGBA'
+    file_output.file_slots.clear()
+    for pass_name in passes:
+        file_output.file_slots.new(pass_name)
+        tree.links.new(file_output.inputs[pass_name],
+                       render_layers.outputs[pass_name])
+    return saved_state
+
+
+def viewer_output_setup(context: Context, denoise: bool=False) -> dict:
+    """Route the combined render to the compositor `Viewer Node`
+    image so render pixels can be read without writing to disk.
+
+    With `denoise`, the render is passed through a CPU OpenImageDenoise
+    `Denoise` node guided by the Cycles albedo and normal passes.
+
+    Returns saved compositor state for `compositor_cleanup`."""
+    view_layer = context.view_layer
+    render     = context.scene.render
+    if denoise:
+        # NOTE: Guide passes must exist before adding the `Render Layers` node
+        saved_denoise = {
+            'denoising_store_passes': view_layer.cycles.denoising_store_passes,
+            'compositor_device':      render.compositor_device
+        }
+        view_layer.cycles.denoising_store_passes = True
+        render.compositor_device = 'CPU'
+    saved_state, render_layers = compositor_setup(context)
+    tree = context.scene.node_tree
+
+    viewer = tree.nodes.new('CompositorNodeViewer')
+    viewer.name     = Global.FLAG_PREFIX + "Viewer"
+    viewer.gd_spawn = True
+    viewer.location = (400, 0)
+    if not denoise:
+        tree.links.new(viewer.inputs['Image'], render_layers.outputs['Image'])
+        return saved_state
+
+    saved_state['denoise'] = saved_denoise
+    denoiser = tree.nodes.new('CompositorNodeDenoise')
+    denoiser.name      = Global.FLAG_PREFIX + "Denoise"
+    denoiser.gd_spawn  = True
+    denoiser.location  = (200, 0)
+    denoiser.prefilter = 'ACCURATE'
+    denoiser.use_hdr   = False
+    links = tree.links
+    links.new(denoiser.inputs['Image'],  render_layers.outputs['Image'])
+    links.new(denoiser.inputs['Albedo'],
+              render_layers.outputs['Denoising Albedo'])
+    links.new(denoiser.inputs['Normal'],
+              render_layers.outputs['Denoising Normal'])
+    links.new(viewer.inputs['Image'],    denoiser.outputs['Image'])
+    return saved_state
+
+
+def get_viewer_pixels() -> numpy.ndarray:
+    """Read the linear `Viewer Node` image into a flat RGBA `float32` array."""
+    image = bpy.data.images['Viewer Node']
+    pixels = numpy.empty(len(image.pixels), dtype=numpy.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels
+
+
+def compositor_cleanup(context: Context, saved_state: dict) -> None:
+    """Remove GrabDoc compositor nodes and restore the original state."""
+    scene = context.scene
+    tree = scene.node_tree
+    for node in tree.nodes[:]:
+        if node.gd_spawn:
+            tree.nodes.remove(node)
+    for name, mute in saved_state['muted'].items():
+        node = tree.nodes.get(name)
+        if node is not None:
+            node.mute = mute
+    scene.render.use_compositing = saved_state['use_compositing']
+    scene.use_nodes = saved_state['use_nodes']
+    if 'denoise' in saved_state:
+        saved_denoise = saved_state['denoise']
+        context.view_layer.cycles.denoising_store_passes = \
+            saved_denoise['denoising_store_passes']
+        scene.render.compositor_device = saved_denoise['compositor_device']
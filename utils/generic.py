@@ -1,7 +1,9 @@
 import os
 import re
 import tomllib
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
 
 import bpy
 from bpy.types import Context
@@ -34,51 +36,126 @@ def get_user_preferences():
     return bpy.context.preferences.addons[package].preferences
 
 
-def save_properties(properties: list) -> dict:
-    """Store all given iterable properties."""
-    saved_properties = {}
-    for data in properties:
-        if data not in saved_properties:
-            saved_properties[data] = {}
-        for attr in dir(data):
-            # NOTE: Triggers unique editor warning
-            if attr == "wireframe_color_type":
+# NOTE: Depth of nested `suppress_updates` blocks
+update_suppression = {'depth': 0}
+
+
+@contextmanager
+def suppress_updates():
+    """Skip expensive property update callbacks, e.g. `scene_setup`,
+    while applying many properties at once. Callers run them once after."""
+    update_suppression['depth'] += 1
+    try:
+        yield
+    finally:
+        update_suppression['depth'] -= 1
+
+
+def is_update_suppressed() -> bool:
+    return update_suppression['depth'] > 0
+
+
+# NOTE: Every render property GrabDoc mutates while baking, ordered so
+# dependent values (e.g. `color_depth` after `file_format`) restore last
+RENDER_STATE_PROPERTIES: dict[str, tuple[str, ...]] = {
+    'scene': ('camera', 'use_nodes'),
+    'scene.gd': ('reference', 'engine'),
+    'scene.world': ('use_nodes',),
+    'scene.world.light_settings': ('distance',),
+    'view_layer': ('use', 'use_pass_z', 'use_pass_normal',
+                   'use_pass_ambient_occlusion'),
+    'scene.render': ('engine', 'filepath', 'use_single_layer',
+                     'resolution_x', 'resolution_y', 'resolution_percentage',
+                     'use_sequencer', 'use_compositing', 'dither_intensity',
+                     'film_transparent', 'filter_size',
+                     'use_persistent_data', 'use_motion_blur'),
+    'scene.render.image_settings': ('file_format', 'color_mode',
+                                    'color_depth', 'compression'),
+    'scene.eevee': ('taa_render_samples', 'taa_samples',
+                    'use_taa_reprojection', 'use_overscan', 'overscan_size'),
+    'scene.cycles': ('samples', 'preview_samples',
+                     'pixel_filter_type', 'filter_width',
+                     'max_bounces', 'diffuse_bounces', 'glossy_bounces',
+                     'transmission_bounces', 'volume_bounces',
+                     'caustics_reflective', 'caustics_refractive',
+                     'use_light_tree', 'use_adaptive_sampling',
+                     'use_denoising'),
+    'scene.display': ('render_aa', 'viewport_aa', 'matcap_ssao_distance'),
+    'scene.display.shading': ('light', 'color_type', 'single_color',
+                              'show_backface_culling', 'show_xray',
+                              'show_shadows', 'show_cavity', 'cavity_type',
+                              'cavity_ridge_factor', 'cavity_valley_factor',
+                              'curvature_ridge_factor',
+                              'curvature_valley_factor', 'use_dof',
+                              'show_object_outline',
+                              'show_specular_highlight'),
+    'scene.display_settings': ('display_device',),
+    'scene.view_settings': ('view_transform', 'look', 'exposure',
+                            'gamma', 'use_curve_mapping')
+}
+
+
+class RenderState():
+    """Snapshot of registered render properties, captured and restored
+    manually or as a context manager around temporary changes."""
+    def __init__(
+            self, context: Context,
+            registry: dict[str, tuple[str, ...]] = None
+        ):
+        self.roots    = {'scene':      context.scene,
+                         'view_layer': context.view_layer}
+        self.registry = RENDER_STATE_PROPERTIES if registry is None else registry
+        self.values:    dict[str, dict[str, Any]] = {}
+
+    def __enter__(self) -> 'RenderState':
+        return self.capture()
+
+    def __exit__(self, *_args) -> None:
+        self.restore()
+
+    def resolve(self, path: str) -> Any | None:
+        """Get the data of a registry path, None if not available."""
+        root, *attrs = path.split('.')
+        data = self.roots[root]
+        for attr in attrs:
+            data = getattr(data, attr, None)
+            if data is None:
+                return None
+        return data
+
+    @staticmethod
+    def get_value(data, attr: str) -> Any:
+        value = getattr(data, attr)
+        if isinstance(value, bpy.types.bpy_prop_array):
+            return tuple(value)
+        return value
+
+    def capture(self) -> 'RenderState':
+        """Store the current value of every registered property."""
+        self.values = {}
+        for path, attrs in self.registry.items():
+            data = self.resolve(path)
+            if data is None:
                 continue
-            saved_properties[data][attr] = getattr(data, attr)
-    return saved_properties
-
-
-def load_properties(properties: dict) -> None:
-    """Set all given properties to their assigned value."""
-    custom_properties = {}
-    for key, values in properties.items():
-        if not isinstance(values, dict):
-            custom_properties[key] = values
-            continue
-        for name, value in values.items():
-            try:
-                setattr(key, name, value)
-            except (AttributeError, TypeError):  # Read only attribute
-                pass
-    # NOTE: Extra entries added after running `save_properties`
-    for key, value in custom_properties.items():
-        name = key.rsplit('.', maxsplit=1)[-1]
-        components = key.split('.')[:-1]
-        root = globals()[components[0]]
-        components = components[1:]
-        # Reconstruct attribute chain
-        obj = root
-        for part in components:
-            next_attr = getattr(obj, part)
-            if next_attr is None:
-                break
-            obj = next_attr
-        if obj == root:
-            continue
-        try:
-            setattr(obj, name, value)
-        except ReferenceError:
-            pass
+            self.values[path] = {
+                attr: self.get_value(data, attr)
+                for attr in attrs if hasattr(data, attr)
+            }
+        return self
+
+    def restore(self) -> None:
+        """Set every changed property back to its captured value."""
+        for path, values in self.values.items():
+            data = self.resolve(path)
+            if data is None:
+                continue
+            for attr, value in values.items():
+                if self.get_value(data, attr) == value:
+                    continue
+                try:
+                    setattr(data, attr, value)
+                except ReferenceError:  # Removed ID
+                    pass
 
 
 def enum_members_from_type(rna_type, prop_str):
@@ -1,3 +1,7 @@
+import tempfile
+
+import numpy # pylint: disable=E0401
+
 import bpy
 
 from ..constants import Global
@@ -21,3 +25,37 @@ def get_filepath() -> str:
     if not gd.filepath:
         return "//"
     return gd.filepath
+
+
+def new_pixel_buffer(width: int, height: int) -> numpy.ndarray:
+    """Allocate a zeroed `(height, width, 4)` `float32` array backed by a
+    temporary file, so full resolution buffers don't need to fit in memory.
+
+    The file is removed once the array is released."""
+    return numpy.memmap(
+        tempfile.TemporaryFile(dir=get_temp_path()),
+        dtype=numpy.float32, mode='w+', shape=(height, width, 4)
+    )
+
+
+def load_image_pixels(filepath: str) -> numpy.ndarray:
+    """Read an image from disk into a flat RGBA `float32` array."""
+    image = bpy.data.images.load(filepath)
+    pixels = numpy.empty(len(image.pixels), dtype=numpy.float32)
+    image.pixels.foreach_get(pixels)
+    bpy.data.images.remove(image)
+    return pixels
+
+
+def save_image_pixels(
+        pixels: numpy.ndarray, filepath: str, size: tuple[int, int]
+    ) -> None:
+    """Write a flat RGBA `float32` array to disk using the
+    scene output format and color management settings."""
+    w, h = size
+    image = bpy.data.images.new(
+        "_gd_save_temp", w, h, alpha=True, float_buffer=True
+    )
+    image.pixels.foreach_set(pixels)
+    image.save_render(bpy.path.abspath(filepath), scene=bpy.context.scene)
+    bpy.data.images.remove(image)
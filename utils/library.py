@@ -0,0 +1,59 @@
+import os
+
+import bpy
+from bpy.types import NodeTree
+
+from ..constants import Global
+
+
+# NOTE: Bump whenever the node graph of a `Baker.node_setup` changes
+LIBRARY_VERSION = 2
+
+
+def get_library_path() -> str:
+    """Get or create the node library directory
+    for the current library and Blender version."""
+    blender_version = "_".join(str(v) for v in bpy.app.version[:2])
+    return bpy.utils.extension_path_user(
+        __package__.rsplit(".", maxsplit=1)[0],
+        path=os.path.join("library", f"v{LIBRARY_VERSION}_{blender_version}"),
+        create=True
+    )
+
+
+def get_library_filepath(library_id: str) -> str:
+    return os.path.join(get_library_path(), f"{library_id}.blend")
+
+
+def get_library_name(library_id: str) -> str:
+    return f"{Global.FLAG_PREFIX}Library {library_id}"
+
+
+def load_library_node_group(library_id: str, name: str) -> NodeTree | None:
+    """Append a node group from the node library and rename it.
+
+    Returns None if the library doesn't have the node group."""
+    filepath = get_library_filepath(library_id)
+    if not os.path.exists(filepath):
+        return None
+    library_name = get_library_name(library_id)
+    with bpy.data.libraries.load(filepath, link=False) as (data_from, data_to):
+        if library_name in data_from.node_groups:
+            data_to.node_groups = [library_name]
+    if not data_to.node_groups or data_to.node_groups[0] is None:
+        return None
+    node_tree = data_to.node_groups[0]
+    node_tree.name = name
+    return node_tree
+
+
+def save_library_node_group(library_id: str, node_tree: NodeTree) -> None:
+    """Write a copy of a freshly built node group to the node library."""
+    library_tree = node_tree.copy()
+    library_tree.name = get_library_name(library_id)
+    try:
+        bpy.data.libraries.write(
+            get_library_filepath(library_id), {library_tree}, fake_user=True
+        )
+    finally:
+        bpy.data.node_groups.remove(library_tree)
@@ -0,0 +1,192 @@
+import os
+import json
+import hashlib
+
+import numpy # pylint: disable=E0401
+
+import bpy
+from bpy.types import Object, NodeTree, bpy_struct
+
+from ..baker import Baker
+from .io import get_filepath, get_format
+
+
+MANIFEST_VERSION = 1
+
+# NOTE: Global settings that change the pixels of every exported map
+SCENE_PROPERTIES = ('resolution_x', 'resolution_y', 'format', 'depth',
+                    'exr_depth', 'png_compression', 'scale', 'use_filtering',
+                    'filter_width', 'coll_rendered', 'use_transparent',
+                    'use_bake_collection', 'use_aov_export',
+                    'use_native_passes', 'use_auto_samples',
+                    'auto_sample_noise')
+
+
+def get_manifest_path() -> str:
+    """Get the manifest path stored next to the exported maps."""
+    gd = bpy.context.scene.gd
+    return os.path.join(
+        bpy.path.abspath(get_filepath()), f"{gd.filename}.grabdoc.json"
+    )
+
+
+def load_manifest() -> dict:
+    """Load the fingerprints of previously exported maps."""
+    path = get_manifest_path()
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding='utf-8') as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {}
+    return manifest.get('bakers', {})
+
+
+def save_manifest(fingerprints: dict[str, dict]) -> None:
+    """Merge and write the fingerprints of newly exported maps."""
+    bakers = load_manifest()
+    bakers.update(fingerprints)
+    manifest = {'version': MANIFEST_VERSION, 'bakers': bakers}
+    with open(get_manifest_path(), "w", encoding='utf-8') as file:
+        json.dump(manifest, file, indent=4)
+
+
+def get_baker_key(baker: Baker) -> str:
+    return f"{baker.ID}_{baker.index}"
+
+
+def is_baker_up_to_date(baker: Baker, fingerprint: str, manifest: dict) -> bool:
+    """Check if an exported map exists and was baked with the same inputs."""
+    entry = manifest.get(get_baker_key(baker))
+    if entry is None or entry.get('fingerprint') != fingerprint:
+        return False
+    filepath = os.path.join(
+        bpy.path.abspath(get_filepath()), entry.get('file', '')
+    )
+    return os.path.isfile(filepath)
+
+
+def get_manifest_entry(baker: Baker, fingerprint: str) -> dict:
+    filename = f"{bpy.context.scene.gd.filename}_{baker.suffix}{get_format()}"
+    return {get_baker_key(baker): {'fingerprint': fingerprint,
+                                   'file':        filename}}
+
+
+def get_baker_fingerprint(baker: Baker, scene_fingerprint: str) -> str:
+    """Fingerprint a baker's properties and node group on top
+    of the shared scene fingerprint."""
+    hasher = hashlib.sha1(scene_fingerprint.encode())
+    hasher.update(baker.ID.encode())
+    update_rna_hash(
+        hasher, baker, exclude=('enabled', 'visibility', 'reimport')
+    )
+    if baker.node_tree:
+        update_node_tree_hash(hasher, baker.node_tree, set())
+    return hasher.hexdigest()
+
+
+def get_scene_fingerprint(objects: list[Object]) -> str:
+    """Fingerprint the global output settings along with the transforms,
+    evaluated meshes and materials of the given objects."""
+    gd = bpy.context.scene.gd
+    hasher = hashlib.sha1()
+    for name in SCENE_PROPERTIES:
+        hasher.update(f"{name}={getattr(gd, name)}".encode())
+    if gd.reference:
+        hasher.update(gd.reference.name_full.encode())
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    visited_trees = set()
+    for ob in sorted(objects, key=lambda ob: ob.name):
+        hasher.update(ob.name.encode())
+        hasher.update(numpy.array(ob.matrix_world, numpy.float32).tobytes())
+        update_mesh_hash(hasher, ob, depsgraph)
+        for slot in ob.material_slots:
+            mat = slot.material
+            if mat is None:
+                continue
+            hasher.update(mat.name_full.encode())
+            if mat.node_tree:
+                update_node_tree_hash(hasher, mat.node_tree, visited_trees)
+    return hasher.hexdigest()
+
+
+def update_mesh_hash(hasher, ob: Object, depsgraph) -> None:
+    """Hash the evaluated geometry of an object."""
+    ob_eval = ob.evaluated_get(depsgraph)
+    try:
+        mesh = ob_eval.to_mesh()
+    except RuntimeError:
+        return
+    if mesh is None:
+        return
+    coords = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float32)
+    mesh.vertices.foreach_get('co', coords)
+    loops = numpy.empty(len(mesh.loops), dtype=numpy.int32)
+    mesh.loops.foreach_get('vertex_index', loops)
+    normals = numpy.empty(len(mesh.loops) * 3, dtype=numpy.float32)
+    mesh.corner_normals.foreach_get('vector', normals)
+    material_indices = numpy.empty(len(mesh.polygons), dtype=numpy.int32)
+    mesh.polygons.foreach_get('material_index', material_indices)
+    for array in (coords, loops, normals, material_indices):
+        hasher.update(array.tobytes())
+    ob_eval.to_mesh_clear()
+
+
+def update_node_tree_hash(hasher, node_tree: NodeTree, visited: set) -> None:
+    """Hash every node, socket value and link of a `NodeTree`,
+    including nested node groups."""
+    if node_tree.name_full in visited:
+        return
+    visited.add(node_tree.name_full)
+    for node in node_tree.nodes:
+        # NOTE: Temporary GrabDoc nodes from an interrupted bake
+        if node.gd_spawn:
+            continue
+        update_rna_hash(hasher, node)
+        for socket in node.inputs:
+            if not socket.is_linked:
+                update_rna_hash(hasher, socket)
+        if getattr(node, 'node_tree', None) is not None:
+            update_node_tree_hash(hasher, node.node_tree, visited)
+    for link in node_tree.links:
+        hasher.update(
+            f"{link.from_node.name}.{link.from_socket.identifier}>"
+            f"{link.to_node.name}.{link.to_socket.identifier}".encode()
+        )
+
+
+def update_rna_hash(
+        hasher, data: bpy_struct, exclude: tuple[str] = ()
+    ) -> None:
+    """Hash all simple properties of a struct, ID pointers are hashed by name.
+
+    Image pointers also include the modification time of their file."""
+    for prop in data.bl_rna.properties:
+        if prop.identifier in ('rna_type', 'location', 'width', 'select') \
+        or prop.identifier in exclude \
+        or prop.type == 'COLLECTION':
+            continue
+        value = getattr(data, prop.identifier, None)
+        if prop.type == 'POINTER':
+            if not isinstance(value, bpy.types.ID):
+                continue
+            value = value.name_full + get_image_mtime(value)
+        elif getattr(prop, 'is_array', False):
+            value = numpy.asarray(value).tolist()
+        elif isinstance(value, set):
+            # NOTE: Enum flags, keep the order stable between sessions
+            value = sorted(value)
+        hasher.update(f"{prop.identifier}={value}".encode())
+
+
+def get_image_mtime(image) -> str:
+    if not isinstance(image, bpy.types.Image) or image.packed_file:
+        return ""
+    filepath = bpy.path.abspath(image.filepath)
+    if not os.path.isfile(filepath):
+        return ""
+    return str(os.path.getmtime(filepath))
@@ -1,10 +1,91 @@
 import bpy
-from bpy.types import Object, NodeTree, Node, NodeTreeInterfaceItem
+from bpy.types import (Object, NodeTree, Node, NodeSocket,
+                       NodeTreeInterfaceItem, Material)
 
 from ..constants import Global
 
 
+# NOTE: Materials touched by `link_group_to_object` since the last
+# `node_cleanup`, with their original state and replaced output links
+material_journal: dict[str, dict] = {}
+
+
+def journal_material(mat: Material, output: Node, use_nodes: bool) -> None:
+    """Record the original state of a material before it is linked."""
+    if mat.name in material_journal:
+        return
+    links = []
+    for node_input in output.inputs:
+        for link in node_input.links:
+            if link.from_node.name.startswith(Global.FLAG_PREFIX[:-1]):
+                continue
+            links.append((link.from_node.name,
+                          link.from_socket.identifier,
+                          node_input.identifier))
+    material_journal[mat.name] = {'use_nodes': use_nodes,
+                                  'output':    output.name,
+                                  'links':     links}
+
+
+def restore_material(mat: Material, entry: dict) -> None:
+    """Remove GrabDoc nodes and restore the journaled links of a material."""
+    node_tree = mat.node_tree
+    nodes = node_tree.nodes
+    for node in [node for node in nodes if node.gd_spawn]:
+        nodes.remove(node)
+
+    output = nodes.get(entry['output'])
+    if output is not None:
+        for from_name, from_identifier, to_identifier in entry['links']:
+            from_node = nodes.get(from_name)
+            if from_node is None:
+                continue
+            from_socket = get_socket(from_node.outputs, from_identifier)
+            to_socket   = get_socket(output.inputs, to_identifier)
+            if from_socket is None or to_socket is None:
+                continue
+            node_tree.links.new(to_socket, from_socket)
+    mat.use_nodes = entry['use_nodes']
+
+
+def get_socket(sockets, identifier: str) -> NodeSocket | None:
+    for socket in sockets:
+        if socket.identifier == identifier:
+            return socket
+    return None
+
+
 def node_cleanup() -> None:
+    """Remove node groups and restore original links of
+    the materials journaled by `link_group_to_object`.
+
+    Falls back to scanning every material if the
+    journal is empty or out of date, e.g. after a reload."""
+    gd_mat = bpy.data.materials.get(Global.GD_MATERIAL_NAME)
+    if gd_mat is not None:
+        bpy.data.materials.remove(gd_mat)
+    warning_text = bpy.data.texts.get(Global.NODE_GROUP_WARN_NAME)
+    if warning_text is not None:
+        bpy.data.texts.remove(warning_text)
+
+    if not material_journal:
+        node_cleanup_all()
+        return
+    is_stale = False
+    for name, entry in material_journal.items():
+        if name == Global.GD_MATERIAL_NAME:
+            continue
+        mat = bpy.data.materials.get(name)
+        if mat is None or mat.node_tree is None:
+            is_stale = True
+            continue
+        restore_material(mat, entry)
+    material_journal.clear()
+    if is_stale:
+        node_cleanup_all()
+
+
+def node_cleanup_all() -> None:
     """Remove node group and return original links if they exist"""
     inputs = get_material_output_sockets()
     for mat in bpy.data.materials:
@@ -16,11 +97,12 @@ def node_cleanup() -> None:
         # Get node group in material
         nodes = mat.node_tree.nodes
         gd_nodes = [node for node in nodes if node.gd_spawn is True]
-        node = None
-        for gd_node in gd_nodes:
-            if gd_node.type != 'FRAME':
-                node = gd_node
-                break
+        node = nodes.get('[GrabDoc]')
+        if node is None:
+            for gd_node in gd_nodes:
+                if gd_node.type != 'FRAME':
+                    node = gd_node
+                    break
         if node is None:
             continue
 
@@ -58,7 +140,24 @@ def node_cleanup() -> None:
             nodes.remove(gd_node)
 
 
-def get_material_output_sockets() -> dict:
+# NOTE: Socket schemas only change between Blender versions
+material_output_cache: dict[tuple, dict[str, str]] = {}
+
+
+def get_material_output_sockets() -> dict[str, str]:
+    """Get the default material output sockets/`inputs` and their
+    socket types, e.g. `{'Displacement': 'NodeSocketVector'}`.
+
+    The schema is captured once per Blender version from a dummy
+    node tree, avoiding new datablocks in the hot path."""
+    schema = material_output_cache.get(bpy.app.version)
+    if schema is None:
+        schema = material_output_cache[bpy.app.version] = \
+            capture_material_output_sockets()
+    return dict(schema)
+
+
+def capture_material_output_sockets() -> dict[str, str]:
     """Create a dummy node tree and capture
     the default material output sockets/`inputs`."""
     tree = bpy.data.node_groups.new('Material Output', 'ShaderNodeTree')
@@ -91,7 +190,7 @@ def get_active_output(node_tree: NodeTree) -> Node:
     for output_node in output_nodes:
         if output_node.is_active_output:
             return output_node
-    return node_tree.new('ShaderNodeOutputMaterial')
+    return node_tree.nodes.new('ShaderNodeOutputMaterial')
 
 
 def get_group_inputs(
@@ -136,6 +235,7 @@ def link_group_to_object(ob: Object, node_tree: NodeTree) -> list[str]:
 
     for slot in ob.material_slots:
         mat = slot.material
+        use_nodes = mat.use_nodes
         mat.use_nodes = True
         if mat.name.startswith(Global.FLAG_PREFIX):
             unlinked[mat.name] = []
@@ -143,13 +243,16 @@ def link_group_to_object(ob: Object, node_tree: NodeTree) -> list[str]:
             unlinked[mat.name] = input_names
 
         output = get_active_output(mat.node_tree)
+        journal_material(mat, output, use_nodes)
 
         node_group = mat.node_tree.nodes.get('[GrabDoc]')
         if node_group is None:
             node_group = mat.node_tree.nodes.new('ShaderNodeGroup')
         node_group.hide      = True
         node_group.gd_spawn  = True
-        node_group.node_tree = node_tree
+        # NOTE: Bakers without a node group leave linked groups alone
+        if node_tree is not None:
+            node_group.node_tree = node_tree
         node_group.name      = "[GrabDoc]"
         node_group.location  = (output.location[0], output.location[1] - 160)
 
@@ -173,16 +276,11 @@ def link_group_to_object(ob: Object, node_tree: NodeTree) -> list[str]:
         # Link identical outputs from BSDF to output node
         try:
             from_output_node = output.inputs[0].links[0].from_node
-            for node_input in from_output_node.inputs:
-                if node_input.name not in input_names or not node_input.links:
-                    continue
-                link = node_input.links[0]
-                mat.node_tree.links.new(
-                    node_group.inputs[node_input.name],
-                    link.from_node.outputs[link.from_socket.name]
-                )
-                if node_input.name in unlinked[mat.name]:
-                    unlinked[mat.name].remove(node_input.name)
+            for name in link_matching_inputs(
+                mat.node_tree, from_output_node, node_group, input_names
+            ):
+                if name in unlinked[mat.name]:
+                    unlinked[mat.name].remove(name)
         except IndexError:
             pass
 
@@ -207,6 +305,194 @@ def link_group_to_object(ob: Object, node_tree: NodeTree) -> list[str]:
     return list(unlinked_names)
 
 
+def swap_linked_groups(node_tree: NodeTree) -> list[str] | None:
+    """Point the `[GrabDoc]` node of every journaled material at another
+    `NodeTree`, relinking its inputs from the journaled output links.
+
+    Returns list of socket names without links, or `None` if a
+    material can't be swapped in place and needs to be relinked."""
+    if not material_journal:
+        return None
+    input_names = [
+        node_input.name for node_input in get_group_inputs(node_tree)
+    ]
+    unlinked_names = set()
+    for name, entry in material_journal.items():
+        mat = bpy.data.materials.get(name)
+        if mat is None or mat.node_tree is None:
+            return None
+        nodes = mat.node_tree.nodes
+        links = mat.node_tree.links
+        node_group = nodes.get('[GrabDoc]')
+        output     = nodes.get(entry['output'])
+        if node_group is None or output is None:
+            return None
+
+        for node_input in node_group.inputs:
+            for link in node_input.links:
+                links.remove(link)
+        node_group.node_tree = node_tree
+
+        linked = []
+        for from_name, from_identifier, to_identifier in entry['links']:
+            from_node = nodes.get(from_name)
+            to_socket = get_socket(output.inputs, to_identifier)
+            if from_node is None or to_socket is None:
+                continue
+            if to_socket.name == 'Surface':
+                linked += link_matching_inputs(
+                    mat.node_tree, from_node, node_group, input_names
+                )
+            from_socket = get_socket(from_node.outputs, from_identifier)
+            if from_socket is not None and to_socket.name in node_group.inputs:
+                links.new(node_group.inputs[to_socket.name], from_socket)
+        links.new(output.inputs["Surface"], node_group.outputs["Shader"])
+
+        if not name.startswith(Global.FLAG_PREFIX):
+            unlinked_names.update(
+                [socket for socket in input_names if socket not in linked]
+            )
+    return list(unlinked_names)
+
+
+def link_matching_inputs(
+        node_tree: NodeTree, from_node: Node, to_node: Node, names: list[str]
+    ) -> list[str]:
+    """Copy the links of identically named inputs from one node to another.
+
+    Returns list of socket names that were linked."""
+    linked = []
+    for node_input in from_node.inputs:
+        if node_input.name not in names or not node_input.links:
+            continue
+        link = node_input.links[0]
+        node_tree.links.new(
+            to_node.inputs[node_input.name],
+            link.from_node.outputs[link.from_socket.name]
+        )
+        linked.append(node_input.name)
+    return linked
+
+
+def link_groups_beside_object(
+        ob: Object, node_trees: list[NodeTree]
+    ) -> list[str]:
+    """Add extra `NodeTree`s next to the `[GrabDoc]` node of the
+    objects' material slots, wired from the same BSDF inputs.
+
+    The extra groups are not connected to the material output and
+    are used for their shader AOV outputs. Must run after
+    `link_group_to_object`.
+
+    Returns list of socket names without links."""
+    unlinked_names = set()
+    for slot in ob.material_slots:
+        mat = slot.material
+        if mat is None:
+            continue
+        nodes = mat.node_tree.nodes
+        node_group = nodes.get('[GrabDoc]')
+        if node_group is None:
+            continue
+        try:
+            from_node = node_group.inputs['Surface'].links[0].from_node
+        except (KeyError, IndexError):
+            from_node = None
+
+        for idx, node_tree in enumerate(node_trees, start=1):
+            aov_group = nodes.get(node_tree.name)
+            if aov_group is None:
+                aov_group = nodes.new('ShaderNodeGroup')
+            aov_group.hide      = True
+            aov_group.gd_spawn  = True
+            aov_group.node_tree = node_tree
+            aov_group.name      = node_tree.name
+            aov_group.location  = (node_group.location[0],
+                                   node_group.location[1] - 40 * idx)
+
+            input_names = [item.name for item in get_group_inputs(node_tree)]
+            if mat.name.startswith(Global.FLAG_PREFIX):
+                continue
+            linked = []
+            if from_node is not None:
+                linked = link_matching_inputs(
+                    mat.node_tree, from_node, aov_group, input_names
+                )
+            unlinked_names.update(
+                name for name in input_names if name not in linked
+            )
+    return list(unlinked_names)
+
+
+def generate_switcher_tree(node_trees: list[NodeTree]) -> NodeTree:
+    """Create a node group with every given `NodeTree` wired in once,
+    outputting the shader picked by a shared selector value.
+
+    Linking the switcher to materials once lets an export move
+    between bakers with `set_switcher_index` instead of relinking."""
+    tree = bpy.data.node_groups.get(Global.SWITCHER_NAME)
+    if tree is not None:
+        bpy.data.node_groups.remove(tree)
+    tree = bpy.data.node_groups.new(Global.SWITCHER_NAME, 'ShaderNodeTree')
+
+    # NOTE: Keep socket defaults for inputs left unlinked in materials
+    for node_tree in node_trees:
+        for item in get_group_inputs(node_tree):
+            if item.name in tree.interface.items_tree:
+                continue
+            socket = tree.interface.new_socket(
+                name=item.name, socket_type=item.socket_type
+            )
+            if hasattr(item, 'default_value'):
+                socket.default_value = item.default_value
+    generate_shader_interface(tree, get_material_output_sockets())
+
+    group_input = tree.nodes.new('NodeGroupInput')
+    group_input.location = (-800, 0)
+    group_output = tree.nodes.new('NodeGroupOutput')
+    group_output.location = (400, 0)
+    selector = tree.nodes.new('ShaderNodeValue')
+    selector.name = Global.SELECTOR_NAME
+    selector.location = (-800, 200)
+
+    shader = None
+    for idx, node_tree in enumerate(node_trees):
+        group = tree.nodes.new('ShaderNodeGroup')
+        group.node_tree = node_tree
+        group.location  = (-400, -200 * idx)
+        for node_input in group.inputs:
+            if node_input.name not in group_input.outputs:
+                continue
+            tree.links.new(node_input, group_input.outputs[node_input.name])
+        if shader is None:
+            shader = group.outputs['Shader']
+            continue
+
+        compare = tree.nodes.new('ShaderNodeMath')
+        compare.operation = 'COMPARE'
+        compare.inputs[1].default_value = idx
+        compare.inputs[2].default_value = .5
+        compare.location = (-200, -200 * idx + 100)
+
+        mix_shader = tree.nodes.new('ShaderNodeMixShader')
+        mix_shader.location = (0, -200 * idx)
+
+        tree.links.new(compare.inputs[0],    selector.outputs[0])
+        tree.links.new(mix_shader.inputs[0], compare.outputs[0])
+        tree.links.new(mix_shader.inputs[1], shader)
+        tree.links.new(mix_shader.inputs[2], group.outputs['Shader'])
+        shader = mix_shader.outputs['Shader']
+    if shader is not None:
+        tree.links.new(group_output.inputs['Shader'], shader)
+    return tree
+
+
+def set_switcher_index(tree: NodeTree, index: int) -> None:
+    """Select which wired `NodeTree` the switcher outputs."""
+    selector = tree.nodes[Global.SELECTOR_NAME]
+    selector.outputs[0].default_value = index
+
+
 def generate_shader_interface(
     tree: NodeTree, inputs: dict[str, str],
     name: str = "Output Cache", hidden: bool=True
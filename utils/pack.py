@@ -3,30 +3,36 @@ import numpy # pylint: disable=E0401
 
 import bpy
 
-from .io import get_filepath, get_format
+from ..baker import Baker
+from .io import get_filepath, get_format, load_image_pixels
 from .baker import get_bakers
 
 
+# NOTE: Pixels of pack channels baked during the current export,
+# encoded like the written files and keyed by channel name
+channel_buffers: dict[str, numpy.ndarray] = {}
+
+
 def pack_image_channels(
-        pack_order: list, name: str, size: tuple[int, int]=None
+        channels: list[numpy.ndarray | None], name: str,
+        size: tuple[int, int]=None
     ) -> bpy.types.Image:
-    """NOTE: Original code sourced from:
+    """Pack single channel pixels into the RGBA channels of a new image.
+
+    Unused color channels are black and an unused alpha
+    channel is left out of the image.
+
+    NOTE: Original code sourced from:
     https://blender.stackexchange.com/questions/274712/how-to-channel-pack-texture-in-python"""
     # Build the packed pixel array
     w, h = size
-    src_array = numpy.empty(w * h * 4, dtype=numpy.float32)
-    dst_array = numpy.ones(w * h * 4, dtype=numpy.float32)
-    has_alpha = True
-
-    # Fetch pixels from the source image and copy channels
-    for pack_item in pack_order:
-        image = pack_item[0]
-        image.pixels.foreach_get(src_array)
-        for src_chan, dst_chan in pack_item[1:]:
-            if dst_chan == 3 and image.name == "_gd_pack_temp":
-                has_alpha = False
-                continue
-            dst_array[dst_chan::4] = src_array[src_chan::4]
+    dst_array = numpy.zeros(w * h * 4, dtype=numpy.float32)
+    for dst_chan, channel in enumerate(channels):
+        if channel is not None:
+            dst_array[dst_chan::4] = channel
+    has_alpha = channels[3] is not None
+    if not has_alpha:
+        dst_array[3::4] = 1
 
     # Create image from the packed pixels
     dst_image = bpy.data.images.new(name, w, h, is_data=True, alpha=has_alpha)
@@ -61,6 +67,67 @@ def get_channel_path(channel: str) -> str | None:
     return filepath
 
 
+def get_channel_name(baker: Baker) -> str:
+    return f"{baker.ID}_{baker.index}"
+
+
+def is_pack_channel(baker: Baker) -> bool:
+    """Check if the given baker is used by map packing."""
+    gd = bpy.context.scene.gd
+    if not gd.use_pack_maps:
+        return False
+    channels = (gd.channel_r, gd.channel_g, gd.channel_b, gd.channel_a)
+    return get_channel_name(baker) in channels
+
+
+def get_file_channel(
+        channel: numpy.ndarray, view_transform: str, look: str
+    ) -> numpy.ndarray | None:
+    """Encode linear channel pixels the way they are written to disk.
+
+    Returns None if the color management can't be reproduced."""
+    # NOTE: EXR files are always written scene linear
+    if bpy.context.scene.gd.format == 'OPEN_EXR':
+        return channel
+    if look != 'None':
+        return None
+    channel = numpy.clip(channel, 0, 1)
+    if view_transform == 'Raw':
+        return channel
+    if view_transform == 'Standard':
+        return numpy.where(
+            channel <= .0031308,
+            channel * 12.92,
+            1.055 * numpy.power(channel, 1 / 2.4) - .055
+        ).astype(numpy.float32)
+    return None
+
+
+def store_channel_pixels(baker: Baker, pixels: numpy.ndarray) -> None:
+    """Keep the red channel of an exported map in memory for packing."""
+    if not is_pack_channel(baker):
+        return
+    channel = get_file_channel(
+        pixels[0::4], baker.VIEW_TRANSFORM, baker.contrast
+    )
+    if channel is None:
+        return
+    channel_buffers[get_channel_name(baker)] = channel
+
+
+def get_channel_pixels(channel: str) -> numpy.ndarray | None:
+    """Get the single channel pixels of a pack channel, read
+    from disk only if it wasn't baked during this export."""
+    if channel == "none":
+        return None
+    if channel in channel_buffers:
+        return channel_buffers[channel]
+    filepath = get_channel_path(channel)
+    if filepath is None:
+        return None
+    return load_image_pixels(filepath)[0::4]
+
+
 def is_pack_maps_enabled() -> bool:
     """Checks if the chosen pack channels
     match the enabled maps to export.
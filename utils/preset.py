@@ -0,0 +1,174 @@
+import os
+import re
+import ast
+import json
+
+import bpy
+from bpy.types import PropertyGroup
+from bpy.props import CollectionProperty
+
+from ..baker import Baker
+from ..constants import Global
+
+
+PRESET_VERSION = 1
+
+# NOTE: Data-block collections used to resolve pointer properties by name
+ID_COLLECTIONS = {'Image': 'images', 'NodeTree': 'node_groups'}
+
+# NOTE: Assignments written by the Python presets of earlier versions,
+# e.g. `gd.resolution_x = 2048` or `gd.normals[0].suffix = 'normal'`
+LEGACY_ASSIGNMENT = re.compile(r"gd\.(?P<name>\w+)(?:\[0\]\.(?P<prop>\w+))?")
+
+
+def get_preset_path() -> str:
+    return bpy.utils.user_resource(
+        'SCRIPTS', path=os.path.join("presets", "grab_doc"), create=True
+    )
+
+
+def get_property_values(
+        data: PropertyGroup, exclude: tuple[str, ...]=()
+    ) -> dict:
+    """Get JSON compatible values of all editable properties."""
+    values = {}
+    for prop in data.bl_rna.properties:
+        name = prop.identifier
+        if name == 'rna_type' or name in exclude \
+        or prop.is_readonly or prop.type == 'COLLECTION':
+            continue
+        value = getattr(data, name)
+        if prop.type == 'POINTER':
+            if prop.fixed_type.identifier not in ID_COLLECTIONS:
+                continue
+            value = value.name if value is not None else None
+        elif prop.type == 'ENUM' and prop.is_enum_flag:
+            value = sorted(value)
+        elif getattr(prop, 'is_array', False):
+            value = list(value)
+        values[name] = value
+    return values
+
+
+def set_property_values(data: PropertyGroup, values: dict) -> None:
+    """Assign values from `get_property_values`, skipping
+    properties or items that no longer exist."""
+    for name, value in values.items():
+        prop = data.bl_rna.properties.get(name)
+        if prop is None or prop.is_readonly:
+            continue
+        if prop.type == 'POINTER':
+            collection = ID_COLLECTIONS.get(prop.fixed_type.identifier)
+            if collection is None:
+                continue
+            value = getattr(bpy.data, collection).get(value or "")
+        elif prop.type == 'ENUM' and prop.is_enum_flag:
+            value = set(value)
+        try:
+            setattr(data, name, value)
+        except (TypeError, ValueError):
+            # NOTE: Dynamic enum items may not exist in this scene
+            continue
+
+
+def get_baker_exclusions(baker: Baker) -> tuple[str, ...]:
+    """Get internal baker properties that shouldn't be stored in presets."""
+    # NOTE: Bakers overriding `node_tree` expose it to the user
+    if 'node_tree' in type(baker).__annotations__:
+        return ('index',)
+    return ('index', 'node_tree')
+
+
+def get_preset(gd: PropertyGroup) -> dict:
+    """Serialize the GrabDoc properties and every baker instance."""
+    baker_ids = [baker.ID for baker in Baker.__subclasses__()]
+    properties = get_property_values(
+        gd, tuple(name for name in gd.bl_rna.properties.keys()
+                  if name.startswith("preview_"))
+    )
+    bakers = {}
+    for baker_id in baker_ids:
+        bakers[baker_id] = [
+            get_property_values(baker, get_baker_exclusions(baker))
+            for baker in getattr(gd, baker_id)
+        ]
+    return {'version': PRESET_VERSION,
+            'properties': properties,
+            'bakers': bakers}
+
+
+def set_baker_values(collection: CollectionProperty, presets: list) -> None:
+    """Match a baker collection to the given baker presets,
+    reusing existing instances and initializing new ones."""
+    while len(collection) > len(presets):
+        baker = collection[-1]
+        if baker.node_tree \
+        and baker.node_tree.name.startswith(Global.FLAG_PREFIX):
+            bpy.data.node_groups.remove(baker.node_tree)
+        collection.remove(len(collection)-1)
+    for idx, values in enumerate(presets):
+        if idx < len(collection):
+            baker = collection[idx]
+        else:
+            baker = collection.add()
+            baker.initialize()
+        set_property_values(baker, values)
+
+
+def get_legacy_preset(filepath: str) -> dict | None:
+    """Convert a Python preset of earlier versions into
+    a preset dictionary without executing it.
+
+    Returns None if the file can't be parsed."""
+    try:
+        with open(filepath, encoding='utf-8') as file:
+            statements = ast.parse(file.read()).body
+    except (OSError, SyntaxError, ValueError):
+        return None
+    properties = {}
+    bakers: dict[str, list[dict]] = {}
+    for statement in statements:
+        if not isinstance(statement, ast.Assign) \
+        or len(statement.targets) != 1:
+            continue
+        match = LEGACY_ASSIGNMENT.fullmatch(ast.unparse(statement.targets[0]))
+        if match is None:
+            continue
+        try:
+            value = ast.literal_eval(statement.value)
+        except (ValueError, TypeError, SyntaxError):
+            # NOTE: Data-block pointers aren't literals
+            continue
+        if isinstance(value, set):
+            value = sorted(value)
+        elif isinstance(value, tuple):
+            value = list(value)
+        name, prop = match.group('name', 'prop')
+        if prop is None:
+            properties[name] = value
+        else:
+            bakers.setdefault(name, [{}])[0][prop] = value
+    return {'version': PRESET_VERSION,
+            'properties': properties,
+            'bakers': bakers}
+
+
+def migrate_legacy_presets() -> None:
+    """Convert the Python presets of earlier versions to JSON presets once,
+    keeping each original file with a `.migrated` extension."""
+    preset_path = get_preset_path()
+    for filename in os.listdir(preset_path):
+        name, extension = os.path.splitext(filename)
+        if extension != '.py':
+            continue
+        filepath  = os.path.join(preset_path, filename)
+        json_path = os.path.join(preset_path, name + ".json")
+        preset = get_legacy_preset(filepath)
+        if preset is None or os.path.exists(json_path):
+            continue
+        try:
+            with open(json_path, 'w', encoding='utf-8') as file:
+                json.dump(preset, file, indent=4)
+            os.replace(filepath, filepath + ".migrated")
+        except OSError:
+            continue
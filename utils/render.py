@@ -1,9 +1,14 @@
+from typing import Any, Callable, Generator
+
+import numpy # pylint: disable=E0401
+
 import bpy
-from mathutils import Vector
-from bpy.types import Object
+from bpy.types import Object, Context, Scene
 
 from ..constants import Global
-from .generic import get_user_preferences
+from .generic import get_user_preferences, RenderState
+from .tracker import scene_tracker
+from .io import new_pixel_buffer
 
 
 def is_object_gd_valid(
@@ -31,29 +36,57 @@ def is_object_gd_valid(
     return True
 
 
-def in_viewing_frustrum(vector: Vector) -> bool:
-    """Decide whether a given object is within the cameras viewing frustrum."""
+def get_viewing_frustrum() -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Get the lower and upper world space bounds of the cameras
+    viewing frustrum, based on the background plane."""
     bg_plane = bpy.data.objects[Global.BG_PLANE_NAME]
-    viewing_frustrum = (
-        Vector((bg_plane.dimensions.x * -1.25 + bg_plane.location[0],
-                bg_plane.dimensions.y * -1.25 + bg_plane.location[1],
-                -100)),
-        Vector((bg_plane.dimensions.x * 1.25 + bg_plane.location[0],
-                bg_plane.dimensions.y * 1.25 + bg_plane.location[1],
-                100))
-    )
-    for i in range(0, 3):
-        if (vector[i] < viewing_frustrum[0][i] \
-        and vector[i] < viewing_frustrum[1][i] \
-        or  vector[i] > viewing_frustrum[0][i] \
-        and vector[i] > viewing_frustrum[1][i]):
-            return False
-    return True
+    extent = numpy.array((bg_plane.dimensions.x * 1.25,
+                          bg_plane.dimensions.y * 1.25, 0))
+    center = numpy.array((bg_plane.location[0], bg_plane.location[1], 0))
+    lower = center - extent
+    upper = center + extent
+    lower[2], upper[2] = -100, 100
+    return lower, upper
+
+
+def get_bbox_centers(objects) -> numpy.ndarray:
+    """Get the world space bounding box centers of a collection of objects."""
+    count = len(objects)
+    matrices = numpy.empty(count * 16, dtype=numpy.float32)
+    objects.foreach_get('matrix_world', matrices)
+    bboxes = numpy.empty(count * 24, dtype=numpy.float32)
+    objects.foreach_get('bound_box', bboxes)
+
+    # NOTE: RNA matrices are stored column major
+    matrices = matrices.reshape(count, 4, 4).transpose(0, 2, 1)
+    centers = numpy.ones((count, 4), dtype=numpy.float32)
+    centers[:, :3] = bboxes.reshape(count, 8, 3).mean(axis=1)
+    return numpy.einsum('nij,nj->ni', matrices, centers)[:, :3]
+
+
+# NOTE: Rendered objects are reused until the scene tracker reports changes
+rendered_objects_cache: dict = {'key': None, 'objects': ()}
 
 
 def get_rendered_objects() -> set[Object] | None:
     """Generate a list of all objects that will be rendered
-    based on its origin position in world space"""
+    based on its origin position in world space.
+
+    Results are cached until relevant objects change."""
+    scene      = bpy.context.scene
+    view_layer = bpy.context.view_layer
+    key = (scene.as_pointer(), view_layer.as_pointer(),
+           scene.gd.use_bake_collection,
+           get_user_preferences().render_within_frustrum,
+           len(view_layer.objects), len(bpy.data.objects),
+           scene_tracker.generation('objects', 'transforms'))
+    if rendered_objects_cache['key'] != key:
+        rendered_objects_cache['objects'] = tuple(find_rendered_objects())
+        rendered_objects_cache['key'] = key
+    return set(rendered_objects_cache['objects'])
+
+
+def find_rendered_objects() -> set[Object]:
     objects = set()
     if bpy.context.scene.gd.use_bake_collection:
         for coll in bpy.data.collections:
@@ -62,72 +95,122 @@ def get_rendered_objects() -> set[Object] | None:
             objects.update(
                 [ob for ob in coll.all_objects if is_object_gd_valid(ob)]
             )
-            # TODO: Old method; profile it
-            #for ob in coll.all_objects:
-            #    if is_valid_grabdoc_object(ob):
-            #        rendered_obs.add(ob.name)
         return objects
 
-    objects = bpy.context.view_layer.objects
-    objects = [ob for ob in objects if is_object_gd_valid(ob)]
-
+    layer_objects = bpy.context.view_layer.objects
     if not get_user_preferences().render_within_frustrum:
-        return objects
+        return {ob for ob in layer_objects if is_object_gd_valid(ob)}
 
     # Distance based filter
-    filtered_objects = set()
-    for ob in objects:
-        local_bbox_center = .125 * sum(
-            (Vector(ob) for ob in ob.bound_box), Vector()
-        )
-        global_bbox_center = ob.matrix_world @ local_bbox_center
-        if in_viewing_frustrum(global_bbox_center):
-            filtered_objects.add(ob)
-    return filtered_objects
+    if not len(layer_objects):
+        return objects
+    lower, upper = get_viewing_frustrum()
+    centers = get_bbox_centers(layer_objects)
+    in_frustrum = numpy.all((centers >= lower) & (centers <= upper), axis=1)
+    for ob, is_visible in zip(layer_objects, in_frustrum):
+        if is_visible and is_object_gd_valid(ob):
+            objects.add(ob)
+    return objects
 
 
 def set_guide_height(objects: list[Object]=None) -> None:
     """Set guide height maximum property value
     based on a given list of objects"""
-    tallest_vert = find_tallest_object(objects)
+    tallest_vert = get_tallest_object(objects)
     bg_plane = bpy.data.objects.get(Global.BG_PLANE_NAME)
     bpy.context.scene.gd.height[0].distance = tallest_vert-bg_plane.location[2]
 
 
+# NOTE: Tallest point is reused until geometry or transforms change
+tallest_object_cache: dict = {'key': None, 'height': 0.0}
+
+
+def get_tallest_object(objects: list[Object]=None) -> float:
+    """Cached `find_tallest_object`."""
+    if objects is None:
+        objects = bpy.context.selectable_objects
+    key = (frozenset(ob.as_pointer() for ob in objects),
+           scene_tracker.generation('objects', 'geometry',
+                                    'transforms', 'properties'))
+    if tallest_object_cache['key'] != key:
+        tallest_object_cache['height'] = find_tallest_object(objects)
+        tallest_object_cache['key'] = key
+    return tallest_object_cache['height']
+
+
 def find_tallest_object(objects: list[Object]=None) -> float:
     """Find the tallest points in the viewlayer by looping
-    through objects to find the highest vertex on the Z axis"""
+    through objects to find the highest vertex on the Z axis.
+
+    Objects are visited from the highest world space bounding box
+    down, stopping once no bounding box can beat the current maximum."""
     if objects is None:
         objects = bpy.context.selectable_objects
 
     depsgraph = bpy.context.evaluated_depsgraph_get()
-    tallest_verts = []
-    objects = [
-        ob for ob in objects if not ob.name.startswith(Global.FLAG_PREFIX)
-    ]
+    candidates = []
     for ob in objects:
+        if ob.name.startswith(Global.FLAG_PREFIX):
+            continue
         ob_eval = ob.evaluated_get(depsgraph)
-        try:
-            mesh_eval = ob_eval.to_mesh()
-        except RuntimeError:
-            # NOTE: Object can't be evaluates as mesh; maybe particle system
+        matrix = numpy.array(ob_eval.matrix_world, dtype=numpy.float64)
+        bbox_z = numpy.array(ob_eval.bound_box) @ matrix[2, :3] + matrix[2, 3]
+        candidates.append((bbox_z.max(), ob_eval, matrix))
+    candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+
+    tallest_vert = None
+    mesh_cache = {}
+    for bbox_top, ob_eval, matrix in candidates:
+        if tallest_vert is not None and bbox_top <= tallest_vert:
+            break
+        mesh_coords = get_mesh_coords(ob_eval, mesh_cache)
+        if mesh_coords is None:
             continue
+        coords, min_z, max_z = mesh_coords
+        z_axis, z_offset = matrix[2, :3], matrix[2, 3]
+        # NOTE: Without X/Y rotation the local Z range is enough
+        if z_axis[0] == z_axis[1] == 0:
+            max_co = z_axis[2] * (max_z if z_axis[2] >= 0 else min_z)
+        else:
+            max_co = (coords @ z_axis).max()
+        max_co += z_offset
+        if tallest_vert is None or max_co > tallest_vert:
+            tallest_vert = max_co
 
-        global_vert_co = [
-            ob_eval.matrix_world @ v.co for v in mesh_eval.vertices
-        ]
-
-        # NOTE: Find highest Z-value amongst
-        # object's vertices and append to list
-        if len(global_vert_co):
-            max_z_co = max(co.z for co in global_vert_co)
-            tallest_verts.append(max_z_co)
-        ob_eval.to_mesh_clear()
-    if not tallest_verts:
+    if tallest_vert is None:
         bpy.context.scene.gd.height[0].method = 'manual'
         # NOTE: Fallback to manual height value
         return bpy.context.scene.gd.height[0].distance
-    return max(tallest_verts)
+    return float(tallest_vert)
+
+
+def get_mesh_coords(
+        ob_eval: Object, mesh_cache: dict
+    ) -> tuple[numpy.ndarray, float, float] | None:
+    """Get the local vertex coordinates and Z range of an evaluated
+    object, shared between objects using the same unmodified mesh."""
+    key = None
+    if ob_eval.type == 'MESH' and not ob_eval.modifiers:
+        key = ob_eval.original.data.as_pointer()
+        if key in mesh_cache:
+            return mesh_cache[key]
+
+    try:
+        mesh_eval = ob_eval.to_mesh()
+    except RuntimeError:
+        # NOTE: Object can't be evaluated as mesh; maybe particle system
+        return None
+    mesh_coords = None
+    if mesh_eval is not None and len(mesh_eval.vertices):
+        coords = numpy.empty(len(mesh_eval.vertices) * 3, dtype=numpy.float32)
+        mesh_eval.vertices.foreach_get('co', coords)
+        coords = coords.reshape(-1, 3)
+        mesh_coords = (coords, coords[:, 2].min(), coords[:, 2].max())
+    ob_eval.to_mesh_clear()
+
+    if key is not None:
+        mesh_cache[key] = mesh_coords
+    return mesh_coords
 
 
 def set_color_management(
@@ -145,3 +228,170 @@ def set_color_management(
     view_settings.exposure          = 0
     view_settings.gamma             = 1
     view_settings.use_curve_mapping = False
+
+
+# NOTE: Values replaced by the last applied baker render profile
+render_profile_state: dict = {'state': None}
+
+
+def apply_render_profile(
+        context: Context, profile: dict[str, dict[str, Any]]
+    ) -> None:
+    """Apply the render profile of a baker, first restoring
+    the values replaced by the previously applied profile."""
+    clear_render_profile()
+    if not profile:
+        return
+    state = RenderState(
+        context, {path: tuple(values) for path, values in profile.items()}
+    ).capture()
+    for path, values in profile.items():
+        data = state.resolve(path)
+        if data is None:
+            continue
+        for attr, value in values.items():
+            if hasattr(data, attr):
+                setattr(data, attr, value)
+    render_profile_state['state'] = state
+
+
+def clear_render_profile(restore: bool=True) -> None:
+    """Restore the values replaced by the last applied render profile.
+
+    Pass `restore=False` when the scene is about
+    to be discarded, e.g. before loading a file."""
+    state = render_profile_state['state']
+    if state is None:
+        return
+    render_profile_state['state'] = None
+    if restore:
+        state.restore()
+
+
+# NOTE: Workbench anti-aliasing sample counts in ascending order
+WORKBENCH_SAMPLES = ('FXAA', '5', '8', '11', '16', '32')
+
+# NOTE: Longest side of auto sample probe renders
+PROBE_SIZE = 256
+
+
+def get_sample_ladder(engine: str, samples: int | str) -> list[int | str]:
+    """Get the sample counts to probe for the given engine,
+    doubling up to the configured maximum `samples`."""
+    if engine == 'BLENDER_WORKBENCH':
+        if samples not in WORKBENCH_SAMPLES:
+            return [samples]
+        return list(WORKBENCH_SAMPLES[:WORKBENCH_SAMPLES.index(samples)+1])
+    ladder = [1]
+    while ladder[-1] * 2 < samples:
+        ladder.append(ladder[-1] * 2)
+    if samples > 1:
+        ladder.append(samples)
+    return ladder
+
+
+def set_render_samples(scene: Scene, samples: int | str) -> None:
+    if scene.render.engine == 'CYCLES':
+        scene.cycles.samples = samples
+    elif scene.render.engine == 'BLENDER_WORKBENCH':
+        scene.display.render_aa = samples
+    else:
+        scene.eevee.taa_render_samples = samples
+
+
+def get_probe_percentage(scene: Scene) -> int:
+    """Get the resolution percentage fitting probe renders in `PROBE_SIZE`."""
+    gd = scene.gd
+    longest = max(gd.resolution_x, gd.resolution_y)
+    return max(1, min(100, PROBE_SIZE * 100 // longest))
+
+
+def get_pixel_noise(a: numpy.ndarray, b: numpy.ndarray) -> float:
+    """Get the RMS color difference between two RGBA renders."""
+    difference = (a - b).reshape(-1, 4)[:, :3]
+    return float(numpy.sqrt(numpy.mean(numpy.square(difference))))
+
+
+def is_tiled_render() -> bool:
+    """Check if the export resolution requires a tiled render."""
+    gd = bpy.context.scene.gd
+    return gd.use_tiled_export \
+       and max(gd.resolution_x, gd.resolution_y) > gd.tile_size
+
+
+def get_render_tiles(
+        width: int, height: int, tile_size: int
+    ) -> list[tuple[int, int, int, int]]:
+    """Split a resolution into `(x0, y0, x1, y1)` pixel rectangles."""
+    tiles = []
+    for y0 in range(0, height, tile_size):
+        for x0 in range(0, width, tile_size):
+            tiles.append((x0, y0,
+                          min(x0 + tile_size, width),
+                          min(y0 + tile_size, height)))
+    return tiles
+
+
+# NOTE: Render jobs are generators yielding `render.render` keyword arguments,
+#       letting the same export code run blocking or from a modal operator
+RenderJob = Generator[dict, None, Any]
+
+
+def run_render_job(job: RenderJob) -> Any:
+    """Run a render job to completion with blocking renders."""
+    try:
+        request = job.send(None)
+        while True:
+            bpy.ops.render.render(**request)
+            request = job.send(None)
+    except StopIteration as result:
+        return result.value
+
+
+def render_tiled(
+        render_tile: Callable[[], RenderJob]
+    ) -> RenderJob:
+    """Render the trim camera frame as tiles by narrowing the camera with
+    `ortho_scale` and shift, then stitch the flat RGBA arrays returned by
+    the `render_tile` job into full resolution arrays.
+
+    Stitched arrays are file backed, so memory use follows the tile size.
+
+    Every tile is rendered with `tile_overlap` extra pixels on each side,
+    which are trimmed afterwards so pixel filtering stays seamless."""
+    scene  = bpy.context.scene
+    gd     = scene.gd
+    render = scene.render
+    camera = bpy.data.objects[Global.TRIM_CAMERA_NAME].data
+    saved_camera = camera.ortho_scale, camera.shift_x, camera.shift_y
+
+    width, height = gd.resolution_x, gd.resolution_y
+    overlap       = gd.tile_overlap
+    pixel_size    = camera.ortho_scale / max(width, height)
+
+    stitched = {}
+    try:
+        for x0, y0, x1, y1 in get_render_tiles(width, height, gd.tile_size):
+            tile_x = x1 - x0 + overlap * 2
+            tile_y = y1 - y0 + overlap * 2
+            render.resolution_x = tile_x
+            render.resolution_y = tile_y
+            camera.ortho_scale = pixel_size * max(tile_x, tile_y)
+            camera.shift_x = \
+                ((x0 + x1) / 2 - width / 2) * pixel_size / camera.ortho_scale
+            camera.shift_y = \
+                ((y0 + y1) / 2 - height / 2) * pixel_size / camera.ortho_scale
+
+            tile_pixels = yield from render_tile()
+            for name, pixels in tile_pixels.items():
+                if name not in stitched:
+                    stitched[name] = new_pixel_buffer(width, height)
+                tile = pixels.reshape(tile_y, tile_x, 4)
+                stitched[name][y0:y1, x0:x1] = \
+                    tile[overlap:overlap + y1 - y0, overlap:overlap + x1 - x0]
+            del tile_pixels
+    finally:
+        render.resolution_x = width
+        render.resolution_y = height
+        camera.ortho_scale, camera.shift_x, camera.shift_y = saved_camera
+    return {name: pixels.reshape(-1) for name, pixels in stitched.items()}
@@ -1,17 +1,32 @@
 import os
 
+import numpy # pylint: disable=E0401
+
 import bpy
-import bmesh
-from bpy.types import Context, Object
+from bpy.types import Context, Object, Mesh, Image, Material
 
 from .io import get_filepath
 from .node import get_bsdf
+from .tracker import scene_tracker
+from .generic import is_update_suppressed
 from ..constants import Global, Error
 
 
 # NOTE: Needs self for property update functions to register
 def scene_setup(_self, context: Context) -> None:
-    """Setup all relevant objects, collections, node groups, and properties."""
+    """Setup all relevant objects, collections, node groups, and properties.
+
+    An intact setup is patched in place, otherwise it is rebuilt."""
+    if is_update_suppressed():
+        return
+    if is_scene_intact(context):
+        scene_update(context)
+    else:
+        scene_rebuild(context)
+
+
+def scene_rebuild(context: Context) -> None:
+    """Remove and recreate all GrabDoc objects and collections."""
     gd = context.scene.gd
     context.scene.render.resolution_x = gd.resolution_x
     context.scene.render.resolution_y = gd.resolution_y
@@ -64,62 +79,22 @@ def scene_setup(_self, context: Context) -> None:
         view_layer.layer_collection.children[gd_coll.name]
 
     # Background plane
-    bpy.ops.mesh.primitive_plane_add(size=gd.scale,
-                                     calc_uvs=True,
-                                     align='WORLD',
-                                     location=saved_plane_loc,
-                                     rotation=saved_plane_rot)
-    context.object.name = context.object.data.name = Global.BG_PLANE_NAME
-    plane_ob = bpy.data.objects[Global.BG_PLANE_NAME]
-    plane_ob.select_set(False)
-    plane_ob.show_wire = True
+    plane_coords, plane_faces = get_plane_geometry(gd)
+    plane_mesh = bpy.data.meshes.new(Global.BG_PLANE_NAME)
+    set_plane_geometry(plane_mesh, plane_coords, plane_faces)
+    plane_ob = bpy.data.objects.new(Global.BG_PLANE_NAME, plane_mesh)
+    gd_coll.objects.link(plane_ob)
+    plane_ob.location       = saved_plane_loc
+    plane_ob.rotation_euler = saved_plane_rot
+    plane_ob.show_wire      = True
     plane_ob.lock_scale[0] = \
     plane_ob.lock_scale[1] = \
     plane_ob.lock_scale[2] = True
 
-    if gd.resolution_x != gd.resolution_y:
-        if gd.resolution_x > gd.resolution_y:
-            div_factor = gd.resolution_x / gd.resolution_y
-            plane_ob.scale[1] /= div_factor
-        else:
-            div_factor = gd.resolution_y / gd.resolution_x
-            plane_ob.scale[0] /= div_factor
-        bpy.ops.object.transform_apply(location=False, rotation=False)
-
     # Reference
     if gd.reference and not gd.preview_state:
-        for mat in bpy.data.materials:
-            if mat.name == Global.REFERENCE_NAME:
-                mat.node_tree.nodes.get('Image Texture').image = gd.reference
-                break
-        else:
-            # Create a new material & turn on node use
-            mat = bpy.data.materials.new(Global.REFERENCE_NAME)
-            mat.use_nodes = True
-
-            # Get / load nodes
-            output = None
-            for node in mat.node_tree.nodes:
-                if node.type == "OUTPUT_MATERIAL":
-                    output = node
-                    break
-            output.location = (0,0)
-            mat.node_tree.nodes.remove(get_bsdf(mat.node_tree))
-
-            image = mat.node_tree.nodes.new('ShaderNodeTexImage')
-            image.image = gd.reference
-            image.location = (-300,0)
-
-            mat.node_tree.links.new(output.inputs["Surface"],
-                                    image.outputs["Color"])
-
-        plane_ob.active_material = bpy.data.materials[Global.REFERENCE_NAME]
-
-        for area in context.screen.areas:
-            if area.type != 'VIEW_3D':
-                continue
-            for space in area.spaces:
-                space.shading.color_type = 'TEXTURE'
+        plane_ob.active_material = get_reference_material(gd.reference)
+        set_texture_shading(context)
     else:
         # Refresh original material and delete the reference material
         if saved_mat is not None:
@@ -128,15 +103,6 @@ def scene_setup(_self, context: Context) -> None:
         if Global.REFERENCE_NAME in bpy.data.materials:
             bpy.data.materials.remove(bpy.data.materials[Global.REFERENCE_NAME])
 
-    # Grid
-    if gd.use_grid and gd.grid_subdivs:
-        bm = bmesh.new()
-        bm.from_mesh(plane_ob.data)
-        bmesh.ops.subdivide_edges(bm, edges=bm.edges,
-                                  cuts=gd.grid_subdivs,
-                                  use_grid_fill=True)
-        bm.to_mesh(plane_ob.data)
-
     # Camera
     camera_data = bpy.data.cameras.new(Global.TRIM_CAMERA_NAME)
     camera_data.type               = 'ORTHO'
@@ -176,6 +142,194 @@ def scene_setup(_self, context: Context) -> None:
     gd_coll.hide_select   = not gd.coll_selectable
     gd_coll.hide_viewport = not gd.coll_visible
     gd_coll.hide_render   = not gd.coll_rendered or gd.use_transparent
+    scene_tracker.mark('objects')
+
+
+def is_scene_intact(context: Context) -> bool:
+    """Check if the GrabDoc setup exists and is
+    structurally sound enough to be patched in place."""
+    gd_coll   = bpy.data.collections.get(Global.COLL_CORE_NAME)
+    plane_ob  = bpy.data.objects.get(Global.BG_PLANE_NAME)
+    camera_ob = bpy.data.objects.get(Global.TRIM_CAMERA_NAME)
+    orient_ob = bpy.data.objects.get(Global.ORIENT_GUIDE_NAME)
+    if None in (gd_coll, plane_ob, camera_ob, orient_ob) \
+    or gd_coll.name not in context.scene.collection.children:
+        return False
+    for ob in (plane_ob, camera_ob, orient_ob):
+        if ob.name not in gd_coll.objects:
+            return False
+    if plane_ob.type != 'MESH' \
+    or camera_ob.type != 'CAMERA' or camera_ob.parent != plane_ob \
+    or orient_ob.type != 'MESH' or orient_ob.parent != plane_ob \
+    or len(orient_ob.data.vertices) != 3:
+        return False
+    has_bake_collection = Global.COLL_GROUP_NAME in bpy.data.collections
+    return has_bake_collection == context.scene.gd.use_bake_collection
+
+
+def scene_update(context: Context) -> None:
+    """Patch the existing GrabDoc setup to match the
+    current properties, leaving unchanged data untouched."""
+    gd = context.scene.gd
+    patch_properties(context.scene.render,
+                     resolution_x=gd.resolution_x,
+                     resolution_y=gd.resolution_y)
+
+    # Background plane
+    plane_ob = bpy.data.objects[Global.BG_PLANE_NAME]
+    plane_coords, plane_faces = get_plane_geometry(gd)
+    if not is_mesh_matching(plane_ob.data, plane_coords):
+        set_plane_geometry(plane_ob.data, plane_coords, plane_faces)
+
+    # Reference
+    if gd.reference and not gd.preview_state:
+        mat = get_reference_material(gd.reference)
+        if plane_ob.active_material != mat:
+            plane_ob.active_material = mat
+            set_texture_shading(context)
+    elif Global.REFERENCE_NAME in bpy.data.materials:
+        bpy.data.materials.remove(bpy.data.materials[Global.REFERENCE_NAME])
+
+    # Camera
+    camera_ob = bpy.data.objects[Global.TRIM_CAMERA_NAME]
+    patch_properties(camera_ob.data,
+                     ortho_scale=gd.scale,
+                     clip_end=1000 * (gd.scale / 25))
+    patch_properties(camera_ob,
+                     location=(0, 0, Global.CAMERA_DISTANCE * gd.scale))
+    if context.scene.camera != camera_ob:
+        context.scene.camera = camera_ob
+
+    # Point cloud
+    height_ob = bpy.data.objects.get(Global.HEIGHT_GUIDE_NAME)
+    use_height_guide = \
+        gd.height[0].enabled and gd.height[0].method == 'manual'
+    if height_ob is not None \
+    and (not use_height_guide or len(height_ob.data.vertices) != 8):
+        bpy.data.meshes.remove(height_ob.data)
+        height_ob = None
+        scene_tracker.mark('objects')
+    if height_ob is not None:
+        coords = get_height_guide_coords(context.scene)
+        if not is_mesh_matching(height_ob.data, coords):
+            height_ob.data.vertices.foreach_set('co', coords.ravel())
+            height_ob.data.update()
+    elif use_height_guide:
+        generate_height_guide(Global.HEIGHT_GUIDE_NAME, plane_ob)
+        scene_tracker.mark('objects')
+
+    orient_mesh = bpy.data.objects[Global.ORIENT_GUIDE_NAME].data
+    coords = get_orientation_guide_coords(plane_ob)
+    if not is_mesh_matching(orient_mesh, coords):
+        orient_mesh.vertices.foreach_set('co', coords.ravel())
+        orient_mesh.update()
+
+    gd_coll = bpy.data.collections[Global.COLL_CORE_NAME]
+    patch_properties(gd_coll,
+                     hide_select=not gd.coll_selectable,
+                     hide_viewport=not gd.coll_visible,
+                     hide_render=not gd.coll_rendered or gd.use_transparent)
+
+
+def patch_properties(data, **properties) -> None:
+    """Assign only the properties that differ from the given
+    values, avoiding needless depsgraph updates."""
+    for name, value in properties.items():
+        current = getattr(data, name)
+        if isinstance(value, tuple):
+            if numpy.allclose(current, value):
+                continue
+        elif current == value:
+            continue
+        setattr(data, name, value)
+
+
+def is_mesh_matching(mesh: Mesh, coords: numpy.ndarray) -> bool:
+    """Check if the vertices of a mesh already match the given coordinates."""
+    if len(mesh.vertices) != len(coords):
+        return False
+    mesh_coords = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float32)
+    mesh.vertices.foreach_get('co', mesh_coords)
+    return numpy.allclose(mesh_coords, coords.ravel(), atol=1e-6)
+
+
+def get_plane_geometry(gd) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Get the vertex coordinates and quad indices of the background
+    plane based on the scale, resolution aspect and grid subdivisions."""
+    half_x = half_y = gd.scale / 2
+    if gd.resolution_x > gd.resolution_y:
+        half_y *= gd.resolution_y / gd.resolution_x
+    elif gd.resolution_y > gd.resolution_x:
+        half_x *= gd.resolution_x / gd.resolution_y
+
+    row_size = (gd.grid_subdivs if gd.use_grid else 0) + 2
+    grid_x, grid_y = numpy.meshgrid(numpy.linspace(-half_x, half_x, row_size),
+                                    numpy.linspace(-half_y, half_y, row_size))
+    coords = numpy.zeros((row_size ** 2, 3), dtype=numpy.float32)
+    coords[:, 0] = grid_x.ravel()
+    coords[:, 1] = grid_y.ravel()
+
+    corners = numpy.arange(row_size * (row_size-1))
+    corners = corners.reshape(row_size-1, row_size)[:, :-1].ravel()
+    faces = numpy.stack((corners, corners+1,
+                         corners+row_size+1, corners+row_size), axis=1)
+    return coords, faces
+
+
+def set_plane_geometry(
+        mesh: Mesh, coords: numpy.ndarray, faces: numpy.ndarray
+    ) -> None:
+    """Replace the geometry of the background plane mesh, keeping
+    materials and generating UVs that span the whole plane."""
+    mesh.clear_geometry()
+    mesh.from_pydata(coords.tolist(), [], faces.tolist())
+
+    uv_layer = mesh.uv_layers.get('UVMap') or mesh.uv_layers.new(name='UVMap')
+    loop_coords = coords[faces.ravel(), :2]
+    lower, upper = coords[:, :2].min(axis=0), coords[:, :2].max(axis=0)
+    uv_layer.data.foreach_set(
+        'uv', ((loop_coords-lower) / (upper-lower)).ravel()
+    )
+    mesh.update()
+
+
+def get_reference_material(image: Image) -> Material:
+    """Get or create the material displaying the reference image."""
+    mat = bpy.data.materials.get(Global.REFERENCE_NAME)
+    if mat is not None:
+        image_node = mat.node_tree.nodes.get('Image Texture')
+        if image_node.image != image:
+            image_node.image = image
+        return mat
+
+    # Create a new material & turn on node use
+    mat = bpy.data.materials.new(Global.REFERENCE_NAME)
+    mat.use_nodes = True
+
+    # Get / load nodes
+    output = None
+    for node in mat.node_tree.nodes:
+        if node.type == "OUTPUT_MATERIAL":
+            output = node
+            break
+    output.location = (0,0)
+    mat.node_tree.nodes.remove(get_bsdf(mat.node_tree))
+
+    image_node = mat.node_tree.nodes.new('ShaderNodeTexImage')
+    image_node.image = image
+    image_node.location = (-300,0)
+
+    mat.node_tree.links.new(output.inputs["Surface"],
+                            image_node.outputs["Color"])
+    return mat
+
+
+def set_texture_shading(context: Context) -> None:
+    for area in context.screen.areas:
+        if area.type != 'VIEW_3D':
+            continue
+        for space in area.spaces:
+            space.shading.color_type = 'TEXTURE'
 
 
 def scene_cleanup(context: Context, hard_reset: bool=True) -> None | list:
@@ -184,6 +338,8 @@ def scene_cleanup(context: Context, hard_reset: bool=True) -> None | list:
 
     hard_reset: When refreshing a scene we may want to keep
     certain data-blocks that the user can manipulates"""
+    scene_tracker.mark('objects')
+
     # NOTE: Move objects contained inside the bake group collection
     # to the root collection level and delete the collection
     saved_bake_group_obs = []
@@ -299,11 +455,9 @@ def camera_in_3d_view() -> bool:
         return area.spaces.active.region_3d.view_perspective == 'CAMERA'
 
 
-def generate_height_guide(name: str, plane_ob: Object) -> None:
-    """Generate a mesh that represents the height map range.
-
-    Generally used for `Manual` Height method to visualize the 0-1 range."""
-    scene = bpy.context.scene
+def get_height_guide_coords(scene) -> numpy.ndarray:
+    """Get the vertex coordinates of the height guide, a ring at the
+    camera view frame with stems reaching down to the height range."""
     trim_camera = bpy.data.objects.get(Global.TRIM_CAMERA_NAME)
     camera_view_frame = trim_camera.data.view_frame(scene=scene)
 
@@ -312,9 +466,15 @@ def generate_height_guide(name: str, plane_ob: Object) -> None:
     ]
     ring_vecs = [(v[0], v[1], v[2]+1) for v in camera_view_frame]
     ring_vecs += stems_vecs
+    return numpy.array(ring_vecs, dtype=numpy.float32)
+
 
+def generate_height_guide(name: str, plane_ob: Object) -> None:
+    """Generate a mesh that represents the height map range.
+
+    Generally used for `Manual` Height method to visualize the 0-1 range."""
     mesh = bpy.data.meshes.new(name)
-    mesh.from_pydata(vertices=ring_vecs,
+    mesh.from_pydata(vertices=get_height_guide_coords(bpy.context.scene),
                      edges=[(0,4), (1,5), (2,6),
                             (3,7), (4,5), (5,6),
                             (6,7), (7,4)],
@@ -322,26 +482,35 @@ def generate_height_guide(name: str, plane_ob: Object) -> None:
     mesh.update()
 
     ob = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(ob)
+    bpy.data.collections[Global.COLL_CORE_NAME].objects.link(ob)
     ob.gd_object   = True
     ob.parent      = plane_ob
     ob.hide_select = True
 
 
+def get_orientation_guide_coords(plane_ob: Object) -> numpy.ndarray:
+    """Get the vertex coordinates of the orientation
+    guide arrow, placed above the background plane."""
+    plane_coords = numpy.empty(len(plane_ob.data.vertices) * 3,
+                               dtype=numpy.float32)
+    plane_ob.data.vertices.foreach_get('co', plane_coords)
+    plane_y = plane_coords[1::3].max()
+    return numpy.array([(-.3, plane_y+.1,  0),
+                        (.3,  plane_y+.1,  0),
+                        (0,   plane_y+.35, 0)], dtype=numpy.float32)
+
+
 def generate_orientation_guide(name: str, plane_ob: Object) -> None:
     """Generate a mesh object that sits beside the background plane
     to guide the user to the correct "up" orientation"""
     mesh = bpy.data.meshes.new(name)
-    plane_y = plane_ob.dimensions.y / 2
-    mesh.from_pydata(vertices=[(-.3, plane_y+.1,  0),
-                               (.3,  plane_y+.1,  0),
-                               (0,   plane_y+.35, 0)],
+    mesh.from_pydata(vertices=get_orientation_guide_coords(plane_ob),
                      edges=[(0,2), (0,1), (1,2)],
                      faces=[])
     mesh.update()
 
     ob = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(ob)
+    bpy.data.collections[Global.COLL_CORE_NAME].objects.link(ob)
     ob.parent      = plane_ob
     ob.hide_select = True
     ob.gd_object   = True
@@ -0,0 +1,103 @@
+import bpy
+from bpy.types import Context, Scene
+
+from ..baker import Baker
+from ..constants import Global
+from .baker import baker_setup, baker_cleanup
+from .node import link_group_to_object, node_cleanup
+from .render import get_rendered_objects
+
+
+class BakeSession():
+    """Keeps `baker_setup` applied and GrabDoc node groups linked
+    between single map renders, tearing everything down once."""
+    def __init__(self, context: Context):
+        self.scene: Scene = context.scene
+        self.baker: Baker | None = None
+        self.linked_objects: set[str] = set()
+        self.saved_properties = baker_setup(context)
+
+        # Scale up BG Plane (helps overscan & border pixels)
+        plane_ob = bpy.data.objects[Global.BG_PLANE_NAME]
+        plane_ob.scale[0] = plane_ob.scale[1] = 3
+
+    def apply_baker(self, baker: Baker) -> dict[str, list[str]]:
+        """Apply the settings of the given baker, only linking
+        objects that aren't linked to its node group yet.
+
+        Returns unlinked socket names of newly linked objects."""
+        if self.baker is not None and self.baker != baker:
+            self.baker.cleanup()
+            # NOTE: Linked materials must be restored before relinking,
+            # their outputs are connected to the previous node group
+            if self.baker.node_tree:
+                node_cleanup()
+            self.linked_objects.clear()
+        self.baker = baker
+        baker.setup()
+
+        unlinked = {}
+        if not baker.node_tree:
+            return unlinked
+        for ob in get_rendered_objects():
+            if ob.name in self.linked_objects:
+                continue
+            unlinked[ob.name] = link_group_to_object(ob, baker.node_tree)
+            self.linked_objects.add(ob.name)
+        return unlinked
+
+    def close(self) -> None:
+        """Unlink node groups and restore the scene."""
+        if self.baker is not None:
+            self.baker.cleanup()
+            if self.baker.node_tree:
+                node_cleanup()
+        baker_cleanup(bpy.context, self.saved_properties)
+
+        plane_ob = bpy.data.objects.get(Global.BG_PLANE_NAME)
+        if plane_ob is not None:
+            plane_ob.scale[0] = plane_ob.scale[1] = 1
+
+
+active_session: BakeSession | None = None
+
+
+def get_bake_session() -> BakeSession | None:
+    return active_session
+
+
+def start_bake_session(context: Context) -> BakeSession:
+    global active_session # pylint: disable=W0603
+    end_bake_session()
+    active_session = BakeSession(context)
+    return active_session
+
+
+def end_bake_session(restore: bool=True) -> None:
+    """Close the running bake session, if any.
+
+    Pass `restore=False` when the session data is
+    about to be discarded, e.g. before loading a file."""
+    global active_session # pylint: disable=W0603
+    if active_session is None:
+        return
+    session = active_session
+    active_session = None
+    if restore:
+        session.close()
+
+
+def on_scene_change() -> None:
+    if active_session is None:
+        return
+    if bpy.context.window is None \
+    or bpy.context.window.scene != active_session.scene:
+        end_bake_session()
+
+
+def subscribe_scene_change(owner: object) -> None:
+    """End the bake session when the active scene changes."""
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.Window, "scene"), owner=owner,
+        args=(), notify=on_scene_change
+    )
@@ -0,0 +1,73 @@
+import bpy
+from bpy.types import Object, Collection
+
+
+class ChangeTracker():
+    """Collects scene changes reported by the depsgraph and message
+    bus so caches can skip their scans while nothing relevant changed.
+
+    Every category keeps a generation counter which increments
+    on each change."""
+    CATEGORIES = ('objects', 'geometry', 'transforms', 'properties')
+
+    def __init__(self):
+        self.generations: dict[str, int] = dict.fromkeys(self.CATEGORIES, 0)
+        # NOTE: Object states relevant to `get_rendered_objects`, used
+        # to ignore updates that don't change them, e.g. selection
+        self.object_states: dict[str, tuple] = {}
+
+    def mark(self, category: str) -> None:
+        self.generations[category] += 1
+
+    def reset(self) -> None:
+        """Mark every category as changed, e.g. after undo or file load."""
+        for category in self.CATEGORIES:
+            self.mark(category)
+        self.object_states.clear()
+
+    def generation(self, *categories: str) -> tuple[int, ...]:
+        """Get the generation counters of the given categories,
+        usable as (part of) a cache key."""
+        return tuple(self.generations[category] for category in categories)
+
+    def depsgraph_update(self, depsgraph) -> None:
+        for update in depsgraph.updates:
+            data = update.id
+            # NOTE: Objects are added, removed or hidden through their
+            # collections, bare scene updates happen on almost any edit
+            if isinstance(data, Collection):
+                self.mark('objects')
+            elif isinstance(data, Object):
+                if update.is_updated_transform:
+                    self.mark('transforms')
+                if update.is_updated_geometry:
+                    self.mark('geometry')
+                if update.is_updated_transform or update.is_updated_geometry \
+                or self.update_object_state(data.original):
+                    self.mark('objects')
+
+    def update_object_state(self, ob: Object) -> bool:
+        """Store the visibility state of an object.
+
+        Returns True if it changed or the object is new."""
+        state = (ob.hide_render, ob.gd_object, ob.type)
+        if self.object_states.get(ob.name) == state:
+            return False
+        self.object_states[ob.name] = state
+        return True
+
+    def property_update(self, _name: str) -> None:
+        self.mark('properties')
+
+
+# NOTE: Shared by all GrabDoc caches
+scene_tracker = ChangeTracker()
+
+
+def subscribe_property_changes(owner: object, types: list[type]) -> None:
+    """Track changes to any property of the given GrabDoc types."""
+    for cls in types:
+        bpy.msgbus.subscribe_rna(
+            key=cls, owner=owner,
+            args=(cls.__name__,), notify=scene_tracker.property_update
+        )